@@ -0,0 +1,107 @@
+import numpy as np
+import pandas as pd
+
+# -------------------------------
+# 📈 Equity Curve & Drawdown
+# -------------------------------
+def equity_curve(df):
+    """Cumulative P/L per trade (frame must be in trade order) with running peak and drawdown."""
+    equity = df["net_gain_loss"].fillna(0).to_numpy(dtype="float64").cumsum()
+    peak = np.maximum.accumulate(np.maximum(equity, 0)) if len(equity) else equity
+    return pd.DataFrame({
+        "trade_date": df["trade_date"].to_numpy(),
+        "equity": equity,
+        "peak": peak,
+        "drawdown": equity - peak,
+    })
+
+
+def daily_equity(curve):
+    """End-of-day equity/drawdown, small enough to chart for any history length."""
+    return curve.groupby("trade_date")[["equity", "drawdown"]].last()
+
+
+def max_drawdown(curve):
+    """Return (max_drawdown, longest_underwater_days, longest_underwater_trades)."""
+    if curve.empty:
+        return 0.0, 0, 0
+    underwater = curve["drawdown"].to_numpy() < 0
+    # Each new peak starts a group; a group's underwater rows are one drawdown episode
+    episode = np.cumsum(~underwater)
+    episodes = pd.DataFrame({"episode": episode[underwater], "trade_date": curve["trade_date"].to_numpy()[underwater]})
+    if episodes.empty:
+        return 0.0, 0, 0
+    # Duration runs from the peak (the row just before the episode) to the last underwater row;
+    # episode 0 means the account was underwater from its very first trade
+    dates = curve["trade_date"].to_numpy()
+    peak_dates = np.concatenate((dates[:1], dates[~underwater]))
+    spans = episodes.groupby("episode")["trade_date"].agg(["max", "size"])
+    starts = peak_dates[spans.index.to_numpy()]
+    days = (pd.to_datetime(spans["max"].to_numpy()) - pd.to_datetime(starts)).days
+    return float(curve["drawdown"].min()), int(days.max()), int(spans["size"].max())
+
+# -------------------------------
+# 🔁 Win/Loss Streaks
+# -------------------------------
+def streaks(df):
+    """Return dict with longest win/loss streaks and the current streak (positive = wins)."""
+    wins = df["win_flag"].to_numpy(dtype=bool)
+    if not len(wins):
+        return {"longest_win": 0, "longest_loss": 0, "current": 0}
+    run_id = np.concatenate(([0], np.cumsum(wins[1:] != wins[:-1])))
+    lengths = np.bincount(run_id)
+    run_is_win = wins[np.r_[0, np.flatnonzero(np.diff(run_id)) + 1]]
+    current = int(lengths[-1]) if run_is_win[-1] else -int(lengths[-1])
+    return {
+        "longest_win": int(lengths[run_is_win].max(initial=0)),
+        "longest_loss": int(lengths[~run_is_win].max(initial=0)),
+        "current": current,
+    }
+
+# -------------------------------
+# 🎯 Expectancy & Profit Factor
+# -------------------------------
+def edge_by(df, key):
+    """Per-group trade count, win rate, average win/loss, expectancy and profit factor."""
+    net = df["net_gain_loss"].fillna(0)
+    frame = pd.DataFrame({
+        key: df[key],
+        "net": net,
+        "gain": net.clip(lower=0),
+        "loss": net.clip(upper=0),
+        "win": df["win_flag"].astype(int),
+        "is_gain": (net > 0).astype(int),
+        "is_loss": (net < 0).astype(int),
+    })
+    grouped = frame.groupby(key, observed=True).sum()
+    counts = frame.groupby(key, observed=True).size()
+    result = pd.DataFrame({
+        "trades": counts,
+        "win_rate_%": grouped["win"] / counts * 100,
+        "avg_win": grouped["gain"] / grouped["is_gain"].replace(0, np.nan),
+        "avg_loss": grouped["loss"] / grouped["is_loss"].replace(0, np.nan),
+        "expectancy": grouped["net"] / counts,
+        "profit_factor": grouped["gain"] / grouped["loss"].abs().replace(0, np.nan),
+        "net_gain_loss": grouped["net"],
+    })
+    return result.round(2)
+
+
+def performance_summary(df):
+    """Everything the analytics section renders, computed in vectorized passes."""
+    curve = equity_curve(df)
+    drawdown, drawdown_days, drawdown_trades = max_drawdown(curve)
+    net = df["net_gain_loss"].fillna(0)
+    gross_loss = -net[net < 0].sum()
+    return {
+        "daily_equity": daily_equity(curve),
+        "max_drawdown": drawdown,
+        "drawdown_days": drawdown_days,
+        "drawdown_trades": drawdown_trades,
+        "streaks": streaks(df),
+        "expectancy": float(net.mean()) if len(net) else 0.0,
+        "profit_factor": float(net[net > 0].sum() / gross_loss) if gross_loss else float("inf"),
+        "by_strategy": edge_by(df, "strategy"),
+        "by_emotion": edge_by(df, "emotion"),
+        "by_hour": edge_by(df, "hour"),
+    }
@@ -0,0 +1,126 @@
+"""Time the dashboard's data paths against a scratch Postgres database.
+
+Usage:
+    python -m benchmarks.bench_dashboard --dsn postgresql://localhost/trades_bench \
+        --sizes 10000 100000 1000000 --output bench.json
+
+The target database is TRUNCATEd for every size; never point it at real data.
+"""
+import argparse
+import io
+import json
+import platform
+import sys
+import time
+from datetime import timedelta
+
+import pandas as pd
+
+from benchmarks.synthetic_trades import generate_trades, to_import_csv
+from db import configure_pool, run_query
+from migrate import run_migrations
+from trades import (
+    SELECT_COLUMNS, TABLE_COLUMNS, compact_trades, fetch_trades,
+    fetch_summary, fetch_key_stats, fetch_monthly_profit, fetch_strategy_profit,
+)
+from trade_import import import_trades
+from trade_export import export_csv, export_parquet
+
+# -------------------------------
+# ⏱️ Timing Helpers
+# -------------------------------
+class Recorder:
+    def __init__(self, size, repeat):
+        self.size = size
+        self.repeat = repeat
+        self.results = []
+
+    def run(self, name, fn):
+        """Best of ``repeat`` runs; returns the last result."""
+        best, value = None, None
+        for _ in range(self.repeat):
+            start = time.perf_counter()
+            value = fn()
+            elapsed = time.perf_counter() - start
+            best = elapsed if best is None else min(best, elapsed)
+        rows = len(value) if hasattr(value, "__len__") and not isinstance(value, (str, bytes, tuple)) else None
+        self.results.append({"size": self.size, "step": name, "seconds": round(best, 6), "rows": rows})
+        return value
+
+# -------------------------------
+# 🏁 Benchmark Steps
+# -------------------------------
+def bench_size(size, repeat):
+    rec = Recorder(size, repeat)
+    run_query("TRUNCATE trades RESTART IDENTITY")
+
+    synthetic = generate_trades(size)
+    csv_text = to_import_csv(synthetic)
+    raw = pd.read_csv(io.StringIO(csv_text), dtype=str, keep_default_na=False)
+
+    # CSV import loads the table once (timed a single time: it is not idempotent)
+    start = time.perf_counter()
+    inserted, rejected = import_trades(raw)
+    rec.results.append({"size": size, "step": "csv_import", "seconds": round(time.perf_counter() - start, 6), "rows": inserted})
+    if len(rejected):
+        print(f"⚠️ {len(rejected)} synthetic rows rejected", file=sys.stderr)
+    run_query("ANALYZE trades")
+
+    first, last = synthetic["trade_date"].min().date(), synthetic["trade_date"].max().date()
+    month_start = last - timedelta(days=30)
+
+    raw_rows = rec.run("load_query_full", lambda: run_query(
+        f"SELECT {', '.join(SELECT_COLUMNS)} FROM trades ORDER BY trade_date, trade_time"))
+    rec.run("derived_columns", lambda: compact_trades(pd.DataFrame(raw_rows, columns=TABLE_COLUMNS)))
+    rec.run("load_query_30d", lambda: fetch_trades(month_start, last))
+    rec.run("filter_paper_ondemand_30d", lambda: fetch_trades(month_start, last, True, True))
+    frame = rec.run("filter_full_range", lambda: fetch_trades(first, last))
+
+    rec.run("summary", lambda: [fetch_summary(month_start, last)])
+    rec.run("key_stats", lambda: [fetch_key_stats()])
+    rec.run("monthly_profit", fetch_monthly_profit)
+    rec.run("strategy_profit", lambda: fetch_strategy_profit(first, last))
+    rec.run("frame_charts", lambda: [
+        frame["emotion"].value_counts(),
+        frame["premarket_news"].value_counts(),
+        frame["hour"].value_counts().sort_index(),
+    ])
+
+    export_filters = (first, last, False, False, None, None)
+    rec.run("csv_export", lambda: export_csv(export_filters))
+    rec.run("parquet_export", lambda: export_parquet(export_filters))
+    return rec.results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--dsn", required=True, help="scratch Postgres database (will be truncated)")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000, 1_000_000])
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--output", help="write JSON results here instead of stdout")
+    args = parser.parse_args(argv)
+
+    configure_pool(args.dsn)
+    run_migrations()
+
+    results = []
+    for size in args.sizes:
+        print(f"⏱️ benchmarking {size:,} trades...", file=sys.stderr)
+        results += bench_size(size, args.repeat)
+
+    report = {
+        "python": platform.python_version(),
+        "pandas": pd.__version__,
+        "created_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "results": results,
+    }
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(text)
+    else:
+        print(text)
+
+
+if __name__ == "__main__":
+    main()
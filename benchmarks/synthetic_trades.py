@@ -0,0 +1,75 @@
+from datetime import date
+
+import numpy as np
+import pandas as pd
+
+from trades import TRADE_COLUMNS, STRATEGIES
+
+BUSINESS_DAYS_PER_YEAR = 252
+EMOTIONS = ["Calm", "Rushed", "Confident", "Hesitant"]
+NEWS = ["", "Earnings", "FDA Approval", "Offering", "PR", "Upgrade", "Downgrade", "Merger"]
+
+# -------------------------------
+# 🎲 Synthetic Trade Generator
+# -------------------------------
+def generate_trades(n, start=date(2020, 1, 1), years=3, symbols=300, seed=0):
+    """Return ``n`` realistic-looking trades with the 23 columns insert_trade writes.
+
+    Trades spread over at most ``years`` of business days (trades per day grows
+    with ``n``, so the history and its monthly partitions stay bounded), mostly in
+    the morning session, with P/L fields derived consistently from prices and shares.
+    """
+    rng = np.random.default_rng(seed)
+    days = pd.bdate_range(start, periods=max(1, min(n, BUSINESS_DAYS_PER_YEAR * years)))
+    trade_date = np.sort(rng.choice(days.values, n))
+
+    minutes = np.clip(570 + rng.exponential(75, n), 570, 959).astype(int)  # 9:30 onwards, skewed to the open
+    trade_time = pd.Series(minutes // 60).astype(str).str.zfill(2) + ":" + pd.Series(minutes % 60).astype(str).str.zfill(2)
+
+    alphabet = np.array(list("ABCDEFGHIJKLMNOPQRSTUVWXYZ"))
+    tickers = np.array(["".join(rng.choice(alphabet, rng.integers(2, 5))) for _ in range(symbols)])
+
+    shares = rng.integers(10, 1000, n)
+    buy_price = np.round(np.exp(rng.normal(2.0, 0.8, n)), 2)
+    move = rng.normal(0.002, 0.03, n)
+    sell_price = np.round(buy_price * (1 + move), 2)
+    is_long = rng.random(n) < 0.8
+    direction = np.where(is_long, 1, -1)
+
+    gross_return = np.round((sell_price - buy_price) * shares * direction, 2)
+    fees = np.round(np.maximum(1.0, shares * 0.005), 2)
+    net = np.round(gross_return - fees, 2)
+    win = net > 0
+    total_investment = np.round(shares * buy_price, 2)
+    return_percent = np.round(net / total_investment * 100, 2)
+
+    return pd.DataFrame({
+        "trade_date": trade_date,
+        "trade_time": trade_time.values,
+        "strategy": rng.choice(STRATEGIES, n, p=[0.35, 0.15, 0.25, 0.1, 0.15]),
+        "stock_symbol": rng.choice(tickers, n),
+        "position_type": np.where(is_long, "Long", "Short"),
+        "shares": shares,
+        "buy_price": buy_price,
+        "sell_price": sell_price,
+        "stop_loss_price": np.round(buy_price * (1 - direction * rng.uniform(0.01, 0.05, n)), 2),
+        "premarket_news": rng.choice(NEWS, n),
+        "emotion": rng.choice(EMOTIONS, n, p=[0.4, 0.2, 0.3, 0.1]),
+        "net_gain_loss": net,
+        "return_win": np.where(win, net, 0.0),
+        "return_loss": np.where(win, 0.0, net),
+        "return_percent": np.where(win, return_percent, 0.0),
+        "return_percent_loss": np.where(win, 0.0, return_percent),
+        "total_investment": total_investment,
+        "fees": fees,
+        "gross_return": gross_return,
+        "win_flag": win,
+        "ira_trade": rng.random(n) < 0.1,
+        "paper_trade": rng.random(n) < 0.3,
+        "ondemand_trade": rng.random(n) < 0.2,
+    })[TRADE_COLUMNS]
+
+
+def to_import_csv(trades):
+    """Serialize like the dashboard export so the benchmark exercises the real import parser."""
+    return trades.to_csv(index=False, date_format="%m-%d-%Y")
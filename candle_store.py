@@ -0,0 +1,151 @@
+import os
+from datetime import datetime, time
+from pathlib import Path
+from zoneinfo import ZoneInfo
+
+import numpy as np
+import pandas as pd
+
+DEFAULT_CANDLE_ROOT = Path(__file__).parent / ".cache" / "candles"
+MARKET_TZ = ZoneInfo("America/New_York")
+SESSION_START, SESSION_END = time(4, 0), time(20, 0)     # pre-market through after-hours
+
+# Row layout of each stored (6, n) array: one contiguous row per field
+T, O, H, L, C, V = range(6)
+
+# -------------------------------
+# 🕯️ Memory-mapped Candle Store
+# -------------------------------
+class CandleStore:
+    """Intraday 1-minute candles on disk, one columnar ``.npy`` per symbol/day.
+
+    Arrays are opened with ``mmap_mode="r"`` so reviewing thousands of trades
+    only pages in the days actually touched. Days with no data are stored as
+    empty arrays so they are not fetched again.
+    """
+
+    def __init__(self, root=DEFAULT_CANDLE_ROOT):
+        self.root = Path(root)
+
+    def path(self, symbol, day):
+        return self.root / symbol.upper() / f"{pd.Timestamp(day):%Y-%m-%d}.npy"
+
+    def has(self, symbol, day):
+        return self.path(symbol, day).exists()
+
+    def load(self, symbol, day):
+        path = self.path(symbol, day)
+        return np.load(path, mmap_mode="r") if path.exists() else None
+
+    def save(self, symbol, day, candles):
+        """Store a Finnhub ``stock/candle`` payload; returns the number of bars."""
+        if candles.get("s") == "ok":
+            array = np.array([candles[key] for key in ("t", "o", "h", "l", "c", "v")], dtype="float64")
+        else:
+            array = np.empty((6, 0), dtype="float64")
+        path = self.path(symbol, day)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(".tmp.npy")
+        np.save(tmp, array)
+        os.replace(tmp, path)  # readers never see a half-written file
+        return array.shape[1]
+
+    def missing(self, pairs):
+        return [(symbol, day) for symbol, day in pairs if not self.has(symbol, day)]
+
+# -------------------------------
+# 📥 Bulk, Cached Fetcher
+# -------------------------------
+def _session_bounds(day):
+    day = pd.Timestamp(day).date()
+    start = datetime.combine(day, SESSION_START, MARKET_TZ)
+    end = datetime.combine(day, SESSION_END, MARKET_TZ)
+    return int(start.timestamp()), int(end.timestamp())
+
+
+def trade_days(trades):
+    """Distinct (symbol, day) pairs covered by a trades frame."""
+    pairs = trades[["stock_symbol", "trade_date"]].astype({"stock_symbol": str}).drop_duplicates()
+    return [(symbol, pd.Timestamp(day).date()) for symbol, day in pairs.itertuples(index=False)]
+
+
+def fetch_missing_candles(client, store, pairs, on_result=None):
+    """Download only the symbol/days not yet on disk, concurrently under the client's rate limit."""
+    todo = store.missing(pairs)
+
+    def fetch(pair):
+        symbol, day = pair
+        start, end = _session_bounds(day)
+        return store.save(symbol, day, client.get("stock/candle", symbol=symbol, resolution="1", **{"from": start, "to": end}))
+
+    return client.map_symbols(fetch, todo, on_result=on_result) if todo else []
+
+# -------------------------------
+# 🎯 MAE / MFE / Time in Trade
+# -------------------------------
+EXCURSION_COLUMNS = ["mae", "mfe", "mae_usd", "mfe_usd", "mae_r", "mfe_r", "minutes_in_trade", "exit_reached"]
+
+
+def excursions(trades, store):
+    """Maximum adverse/favorable excursion and time-in-trade for every row of ``trades``.
+
+    Entry is ``buy_price`` for longs and ``sell_price`` for shorts; the trade is
+    treated as closed at the first bar whose range touches the exit price (or
+    the session close). Work is vectorized per symbol/day over all its trades;
+    rows without stored candles come back as NaN.
+    """
+    out = np.full((len(trades), len(EXCURSION_COLUMNS)), np.nan)
+    if trades.empty:
+        return pd.DataFrame(out, index=trades.index, columns=EXCURSION_COLUMNS)
+
+    is_long = (trades["position_type"].astype(str) == "Long").to_numpy()
+    entry = np.where(is_long, trades["buy_price"], trades["sell_price"]).astype("float64")
+    exit_ = np.where(is_long, trades["sell_price"], trades["buy_price"]).astype("float64")
+    risk = np.abs(entry - trades["stop_loss_price"].to_numpy(dtype="float64"))
+    shares = trades["shares"].to_numpy(dtype="float64")
+
+    # A NULL trade_time is "" after compact_trades: no entry minute, so no excursions for that row
+    time_text = trades["trade_time"].astype("string").fillna("").str.slice(0, 5)
+    local = pd.to_datetime(
+        trades["trade_date"].dt.strftime("%Y-%m-%d") + " " + time_text, format="%Y-%m-%d %H:%M", errors="coerce"
+    )
+    aware = local.dt.tz_localize(MARKET_TZ, ambiguous="NaT", nonexistent="NaT")
+    entry_ts = ((aware - pd.Timestamp(0, tz="UTC")) // pd.Timedelta(seconds=1)).fillna(0).to_numpy(dtype="int64")
+    valid_time = (aware.notna() & (time_text != "")).to_numpy()
+
+    positions = pd.Series(np.arange(len(trades)))
+    keys = pd.DataFrame({"symbol": trades["stock_symbol"].astype(str).to_numpy(), "day": trades["trade_date"].dt.date.to_numpy()})
+    for (symbol, day), rows in positions.groupby([keys["symbol"], keys["day"]]):
+        rows = rows.to_numpy()
+        rows = rows[valid_time[rows]]
+        candles = store.load(symbol, day)
+        if candles is None or candles.shape[1] == 0 or not len(rows):
+            continue
+        t, high, low = candles[T], candles[H], candles[L]
+        bar = np.arange(len(t))
+
+        entry_idx = np.searchsorted(t, entry_ts[rows] - 59, side="left")  # bar containing the entry minute
+        after = bar >= entry_idx[:, None]
+        hit = after & (low <= exit_[rows, None]) & (high >= exit_[rows, None])
+        reached = hit.any(axis=1)
+        exit_idx = np.where(reached, hit.argmax(axis=1), len(t) - 1)
+        window = after & (bar <= exit_idx[:, None])
+        has_bars = window.any(axis=1)
+
+        max_high = np.where(window, high, -np.inf).max(axis=1)
+        min_low = np.where(window, low, np.inf).min(axis=1)
+        long_rows = is_long[rows]
+        # Excursions are measured from entry: MAE is never positive, MFE never negative
+        mfe = np.maximum(np.where(long_rows, max_high - entry[rows], entry[rows] - min_low), 0)
+        mae = np.minimum(np.where(long_rows, min_low - entry[rows], entry[rows] - max_high), 0)
+        minutes = (t[exit_idx] - t[np.minimum(entry_idx, len(t) - 1)]) / 60
+
+        target = rows[has_bars]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            out[target] = np.column_stack([
+                mae, mfe, mae * shares[rows], mfe * shares[rows], mae / risk[rows], mfe / risk[rows], minutes, reached,
+            ])[has_bars]
+
+    result = pd.DataFrame(out, index=trades.index, columns=EXCURSION_COLUMNS)
+    result["exit_reached"] = result["exit_reached"].astype("boolean")
+    return result
@@ -0,0 +1,92 @@
+import numpy as np
+import pandas as pd
+
+from trades import STRATEGIES
+
+DEFAULT_CHECKLIST_RULES = {
+    "window_start": "09:30",
+    "window_end": "12:00",
+    "max_trades_per_day": 4,
+    "daily_max_loss": -100.0,
+    "daily_profit_target": 200.0,
+    "approved_strategies": STRATEGIES,
+    "simulator_only": False,
+}
+
+WEEKDAYS = ["Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"]
+
+# -------------------------------
+# 📝 Per-day Checklist Rule Engine
+# -------------------------------
+def _minutes(hhmm):
+    # "09:30" -> 570
+    hours, minutes = str(hhmm).split(":")
+    return int(hours) * 60 + int(minutes)
+
+
+def evaluate_days(df, rules=DEFAULT_CHECKLIST_RULES):
+    """Evaluate the checklist for every trading day in ``df`` in one grouped pass.
+
+    Returns one row per day with counts, P/L, per-rule flags and ``compliant``.
+    """
+    rules = {**DEFAULT_CHECKLIST_RULES, **rules}
+    # trade_time is nullable ("" after compact_trades); a missing time counts as outside the window
+    time_text = df["trade_time"].astype("string")
+    time_text = time_text.where(time_text.str.fullmatch(r"\d\d:\d\d").fillna(False))
+    minutes = time_text.str.slice(0, 2).astype("Int16") * 60 + time_text.str.slice(3, 5).astype("Int16")
+    per_trade = pd.DataFrame({
+        "trade_date": df["trade_date"].dt.normalize(),
+        "trades": 1,
+        "net_gain_loss": df["net_gain_loss"].fillna(0).to_numpy(dtype="float64"),
+        "outside_window": ~minutes.between(_minutes(rules["window_start"]), _minutes(rules["window_end"])).fillna(False),
+        "unapproved_strategy": ~df["strategy"].isin(rules["approved_strategies"]),
+        "live_trades": ~df["paper_trade"].astype(bool),
+    })
+    days = per_trade.groupby("trade_date", sort=True).sum().astype({"outside_window": int, "unapproved_strategy": int, "live_trades": int})
+
+    days["over_trade_limit"] = days["trades"] > rules["max_trades_per_day"]
+    days["max_loss_hit"] = days["net_gain_loss"] <= rules["daily_max_loss"]
+    days["target_reached"] = days["net_gain_loss"] >= rules["daily_profit_target"]
+    violated = (
+        (days["outside_window"] > 0)
+        | (days["unapproved_strategy"] > 0)
+        | days["over_trade_limit"]
+        | days["max_loss_hit"]
+    )
+    if rules["simulator_only"]:
+        violated |= days["live_trades"] > 0
+    days["compliant"] = ~violated
+    return days
+
+
+def violations(days, rules=DEFAULT_CHECKLIST_RULES):
+    """Long table of (trade_date, rule, detail) for every broken rule."""
+    rules = {**DEFAULT_CHECKLIST_RULES, **rules}
+    checks = [
+        ("Trading window", days["outside_window"] > 0, days["outside_window"].astype(str) + " trades outside " + rules["window_start"] + "–" + rules["window_end"]),
+        ("Approved strategies", days["unapproved_strategy"] > 0, days["unapproved_strategy"].astype(str) + " trades with unapproved strategy"),
+        ("Max trades/day", days["over_trade_limit"], days["trades"].astype(str) + f" trades (limit {rules['max_trades_per_day']})"),
+        ("Daily max loss", days["max_loss_hit"], days["net_gain_loss"].map("${:,.2f}".format)),
+    ]
+    if rules["simulator_only"]:
+        checks.append(("Simulator only", days["live_trades"] > 0, days["live_trades"].astype(str) + " live trades"))
+    frames = [
+        pd.DataFrame({"trade_date": days.index[mask.to_numpy()], "rule": name, "detail": detail[mask].to_numpy()})
+        for name, mask, detail in checks
+    ]
+    return pd.concat(frames, ignore_index=True).sort_values(["trade_date", "rule"], ignore_index=True)
+
+
+def compliance_calendar(days):
+    """Week x weekday grid: ✅/⚠️ plus the day's P/L."""
+    if days.empty:
+        return pd.DataFrame(columns=WEEKDAYS[:5])
+    dates = days.index.to_series()
+    cells = pd.DataFrame({
+        "week": (dates - pd.to_timedelta(dates.dt.weekday, unit="D")).dt.strftime("%Y-%m-%d").to_numpy(),
+        "weekday": np.array(WEEKDAYS)[dates.dt.weekday.to_numpy()],
+        "cell": np.where(days["compliant"], "✅ ", "⚠️ ") + days["net_gain_loss"].map("{:+,.0f}".format).to_numpy(),
+    })
+    calendar = cells.pivot(index="week", columns="weekday", values="cell")
+    columns = [day for day in WEEKDAYS if day in calendar.columns or day in WEEKDAYS[:5]]
+    return calendar.reindex(columns=columns).fillna("").rename_axis(index="week of", columns=None)
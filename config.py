@@ -1,9 +1,42 @@
-from config import DB_CONFIG  # ✅ Add this line at the top
-
-def run_query(query, params=None):
-    with psycopg2.connect(**DB_CONFIG) as conn:
-        with conn.cursor() as cursor:
-            cursor.execute(query, params)
-            if cursor.description:
-                return cursor.fetchall()
-            conn.commit()
+import streamlit as st
+
+# -------------------------------
+# 🔌 Database Settings
+# -------------------------------
+DB_CONFIG = {
+    "host": st.secrets["host"],
+    "user": st.secrets["user"],
+    "password": st.secrets["password"],
+    "dbname": st.secrets["database"],
+    "sslmode": "require",
+    "connect_timeout": int(st.secrets.get("db_connect_timeout", 10)),
+}
+
+# -------------------------------
+# 🏊 Connection Pool Settings
+# -------------------------------
+POOL_MIN_CONN = int(st.secrets.get("db_pool_min", 1))
+POOL_MAX_CONN = int(st.secrets.get("db_pool_max", 5))
+POOL_WAIT_TIMEOUT = float(st.secrets.get("db_pool_wait_timeout", 15))      # seconds to wait for a free connection
+POOL_HEALTHCHECK_IDLE = float(st.secrets.get("db_pool_healthcheck_idle", 30))  # ping connections idle longer than this
+STATEMENT_TIMEOUT_MS = int(st.secrets.get("db_statement_timeout_ms", 30000))
+
+# -------------------------------
+# 🐢 Instrumentation Settings
+# -------------------------------
+SLOW_QUERY_MS = float(st.secrets.get("slow_query_ms", 500))
+SLOW_RERUN_MS = float(st.secrets.get("slow_rerun_ms", 2000))
+SLOW_LOG_PATH = st.secrets.get("slow_log_path", "logs/slow_log.jsonl")
+
+# -------------------------------
+# 📝 Checklist Rules
+# -------------------------------
+# Optional [checklist] table in secrets.toml; keys override checklist.DEFAULT_CHECKLIST_RULES
+CHECKLIST_RULES = dict(st.secrets.get("checklist", {}))
+
+# -------------------------------
+# 📈 Finnhub Quota
+# -------------------------------
+# The dashboard's candle fetch and scan_worker.py share one key but rate-limit separately;
+# keep this plus the worker's --calls-per-minute (default 50) within the plan's quota
+FINNHUB_CANDLE_CALLS_PER_MINUTE = int(st.secrets.get("finnhub_candle_calls_per_minute", 10))
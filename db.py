@@ -0,0 +1,145 @@
+import threading
+import time
+from contextlib import contextmanager
+
+import psycopg2
+import streamlit as st
+from psycopg2 import extensions, pool
+
+from instrumentation import record_query
+
+# -------------------------------
+# 🏊 Process-wide Connection Pool
+# -------------------------------
+class ConnectionPool:
+    """Bounded psycopg2 pool that waits for a free slot instead of raising."""
+
+    def __init__(self, minconn, maxconn, wait_timeout, healthcheck_idle, **conn_kwargs):
+        self._pool = pool.ThreadedConnectionPool(minconn, maxconn, **conn_kwargs)
+        self._slots = threading.BoundedSemaphore(maxconn)
+        self._maxconn = maxconn
+        self._wait_timeout = wait_timeout
+        self._healthcheck_idle = healthcheck_idle
+        self._last_used = {}
+
+    def _is_healthy(self, conn):
+        if conn.closed:
+            return False
+        if conn.info.transaction_status != extensions.TRANSACTION_STATUS_IDLE:
+            return False
+        # Only ping connections that sat idle long enough for the server/proxy to drop them
+        if time.monotonic() - self._last_used.get(id(conn), 0) < self._healthcheck_idle:
+            return True
+        try:
+            with conn.cursor() as cursor:
+                cursor.execute("SELECT 1")
+            conn.rollback()
+            return True
+        except psycopg2.Error:
+            return False
+
+    def getconn(self):
+        if not self._slots.acquire(timeout=self._wait_timeout):
+            raise pool.PoolError(f"No database connection available after {self._wait_timeout}s")
+        try:
+            # Every idle connection may be stale (e.g. after a server restart); once they are
+            # all discarded the pool opens a fresh one, so maxconn + 1 attempts are enough
+            for _ in range(self._maxconn + 1):
+                conn = self._pool.getconn()
+                if self._is_healthy(conn):
+                    return conn
+                self._last_used.pop(id(conn), None)
+                self._pool.putconn(conn, close=True)
+            raise pool.PoolError("Could not get a healthy database connection")
+        except Exception:
+            self._slots.release()
+            raise
+
+    def putconn(self, conn):
+        try:
+            broken = conn.closed or conn.info.transaction_status == extensions.TRANSACTION_STATUS_UNKNOWN
+            if broken:
+                self._last_used.pop(id(conn), None)
+            else:
+                self._last_used[id(conn)] = time.monotonic()
+            self._pool.putconn(conn, close=broken)
+        finally:
+            self._slots.release()
+
+
+@st.cache_resource
+def get_pool():
+    # Imported here so scripts using configure_pool() never need Streamlit secrets
+    from config import (
+        DB_CONFIG, POOL_MIN_CONN, POOL_MAX_CONN, POOL_WAIT_TIMEOUT,
+        POOL_HEALTHCHECK_IDLE, STATEMENT_TIMEOUT_MS,
+    )
+    return ConnectionPool(
+        POOL_MIN_CONN,
+        POOL_MAX_CONN,
+        POOL_WAIT_TIMEOUT,
+        POOL_HEALTHCHECK_IDLE,
+        options=f"-c statement_timeout={STATEMENT_TIMEOUT_MS}",
+        keepalives=1,
+        keepalives_idle=30,
+        **DB_CONFIG,
+    )
+
+
+_override_pool = None
+
+
+def configure_pool(dsn, minconn=1, maxconn=4):
+    """Point this process at ``dsn`` instead of the Streamlit secrets (scripts, benchmarks)."""
+    global _override_pool
+    _override_pool = ConnectionPool(minconn, maxconn, wait_timeout=15, healthcheck_idle=30, dsn=dsn)
+
+
+class TimedCursor(extensions.cursor):
+    """Cursor that reports each execute/COPY to instrumentation, like run_query does.
+
+    For paths that need the connection directly (COPY, multi-statement transactions):
+    ``conn.cursor(cursor_factory=TimedCursor)``.
+    """
+
+    def execute(self, query, params=None):
+        started = time.perf_counter()
+        result = super().execute(query, params)
+        record_query(query, 0.0, time.perf_counter() - started, self.rowcount)
+        return result
+
+    def copy_expert(self, sql, file, size=8192):
+        started = time.perf_counter()
+        result = super().copy_expert(sql, file, size)
+        record_query(sql, 0.0, time.perf_counter() - started, self.rowcount)
+        return result
+
+
+@contextmanager
+def get_connection():
+    """Borrow a pooled connection; commits on success, rolls back on error."""
+    db_pool = _override_pool or get_pool()
+    conn = db_pool.getconn()
+    try:
+        yield conn
+        conn.commit()
+    except Exception:
+        if not conn.closed:
+            conn.rollback()
+        raise
+    finally:
+        db_pool.putconn(conn)
+
+# -------------------------------
+# 🔌 Unified run_query
+# -------------------------------
+def run_query(query, params=None):
+    started = time.perf_counter()
+    with get_connection() as conn:
+        acquired = time.perf_counter()
+        with conn.cursor() as cursor:
+            cursor.execute(query, params)
+            rows = cursor.fetchall() if cursor.description else None
+            rowcount = len(rows) if rows is not None else cursor.rowcount
+    record_query(query, acquired - started, time.perf_counter() - acquired, rowcount)
+    return rows
@@ -0,0 +1,55 @@
+"""Local stand-in for Finnhub's trade websocket, for exercising QuoteStream.
+
+Usage: ``python fake_quote_feed.py [port]`` then point the scanner's
+``finnhub_ws_url`` secret at ``ws://localhost:<port>``.
+"""
+import asyncio
+import json
+import random
+import sys
+import time
+
+import websockets
+
+TICK_INTERVAL = 0.5
+
+# -------------------------------------
+# 🎭 Fake Trade Feed
+# -------------------------------------
+async def handle_client(ws):
+    subscribed = set()
+    prices = {}
+
+    async def pump():
+        while True:
+            await asyncio.sleep(TICK_INTERVAL)
+            if not subscribed:
+                await ws.send(json.dumps({"type": "ping"}))
+                continue
+            data = []
+            for symbol in random.sample(sorted(subscribed), k=max(1, len(subscribed) // 3)):
+                price = prices.setdefault(symbol, round(random.uniform(1, 25), 2))
+                prices[symbol] = max(0.5, round(price * random.uniform(0.97, 1.05), 2))
+                data.append({"s": symbol, "p": prices[symbol], "v": random.randint(100, 50_000), "t": int(time.time() * 1000)})
+            await ws.send(json.dumps({"type": "trade", "data": data}))
+
+    pump_task = asyncio.create_task(pump())
+    try:
+        async for raw in ws:
+            message = json.loads(raw)
+            if message.get("type") == "subscribe":
+                subscribed.add(message["symbol"])
+            elif message.get("type") == "unsubscribe":
+                subscribed.discard(message["symbol"])
+    finally:
+        pump_task.cancel()
+
+
+async def main(port):
+    async with websockets.serve(handle_client, "localhost", port):
+        print(f"📡 Fake quote feed on ws://localhost:{port}")
+        await asyncio.Future()
+
+
+if __name__ == "__main__":
+    asyncio.run(main(int(sys.argv[1]) if len(sys.argv) > 1 else 8765))
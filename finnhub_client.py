@@ -0,0 +1,90 @@
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+import requests
+from requests.adapters import HTTPAdapter
+
+FINNHUB_BASE_URL = "https://finnhub.io/api/v1"
+FREE_TIER_CALLS_PER_MINUTE = 60
+
+# -------------------------------------
+# 🪣 Token Bucket Rate Limiter
+# -------------------------------------
+class TokenBucket:
+    """Thread-safe token bucket sized so no 60s window exceeds ``per_minute`` calls.
+
+    Starting with ``burst`` tokens and refilling at ``(per_minute - burst) / 60``
+    per second bounds any one-minute window to ``burst + refill * 60 == per_minute``.
+    """
+
+    def __init__(self, per_minute, burst=None):
+        if per_minute < 2:
+            raise ValueError("per_minute must be at least 2 (one burst token plus a refill)")
+        # Leave at least one call/minute for refill; a zero rate would divide by zero in acquire()
+        burst = burst if burst is not None else per_minute // 6
+        self.capacity = min(max(1, burst), per_minute - 1)
+        self.rate = (per_minute - self.capacity) / 60.0
+        self._tokens = float(self.capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+# -------------------------------------
+# 🌐 Finnhub Client (keep-alive session + retries)
+# -------------------------------------
+class FinnhubClient:
+    def __init__(self, api_key, per_minute=FREE_TIER_CALLS_PER_MINUTE, max_workers=8, max_retries=4, timeout=10):
+        self.api_key = api_key
+        self.limiter = TokenBucket(per_minute)
+        self.max_workers = max_workers
+        self.max_retries = max_retries
+        self.timeout = timeout
+        self.session = requests.Session()
+        self.session.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=max_workers))
+
+    def get(self, endpoint, **params):
+        params["token"] = self.api_key
+        for attempt in range(self.max_retries + 1):
+            self.limiter.acquire()
+            response = self.session.get(f"{FINNHUB_BASE_URL}/{endpoint}", params=params, timeout=self.timeout)
+            if response.status_code != 429 and response.status_code < 500:
+                response.raise_for_status()
+                return response.json()
+            if attempt == self.max_retries:
+                response.raise_for_status()
+            retry_after = response.headers.get("Retry-After")
+            delay = float(retry_after) if retry_after and retry_after.isdigit() else 2 ** attempt
+            time.sleep(delay + random.uniform(0, 0.5))
+
+    def quote(self, symbol):
+        return self.get("quote", symbol=symbol)
+
+    def profile(self, symbol):
+        return self.get("stock/profile2", symbol=symbol)
+
+    def map_symbols(self, fetch, symbols, on_result=None):
+        """Run ``fetch(symbol)`` concurrently; results come back in ``symbols`` order.
+
+        ``on_result(done, total)`` is called as each symbol completes.
+        """
+        results = {}
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            futures = {pool.submit(fetch, symbol): symbol for symbol in symbols}
+            for done, future in enumerate(as_completed(futures), start=1):
+                results[futures[future]] = future.result()
+                if on_result:
+                    on_result(done, len(futures))
+        return [results[symbol] for symbol in symbols]
@@ -0,0 +1,122 @@
+import json
+import re
+import threading
+import time
+from pathlib import Path
+
+import pandas as pd
+import streamlit as st
+
+# Defaults; the dashboard overrides them from config via configure()
+SLOW_QUERY_MS = 500
+SLOW_RERUN_MS = 2000
+SLOW_LOG_PATH = Path(__file__).parent / "logs" / "slow_log.jsonl"
+
+_local = threading.local()
+_log_lock = threading.Lock()
+
+# -------------------------------
+# ⏱️ Per-rerun Profile
+# -------------------------------
+class RerunProfile:
+    """Query and section timings collected during one script run."""
+
+    def __init__(self, page):
+        self.page = page
+        self.started = time.perf_counter()
+        self._last_mark = self.started
+        self.sections = []
+        self.queries = []
+
+    def checkpoint(self, name):
+        now = time.perf_counter()
+        self.sections.append({"section": name, "ms": round((now - self._last_mark) * 1000, 2)})
+        self._last_mark = now
+
+    @property
+    def total_ms(self):
+        return round((time.perf_counter() - self.started) * 1000, 2)
+
+
+def configure(slow_query_ms=None, slow_rerun_ms=None, slow_log_path=None):
+    global SLOW_QUERY_MS, SLOW_RERUN_MS, SLOW_LOG_PATH
+    if slow_query_ms is not None:
+        SLOW_QUERY_MS = slow_query_ms
+    if slow_rerun_ms is not None:
+        SLOW_RERUN_MS = slow_rerun_ms
+    if slow_log_path is not None:
+        SLOW_LOG_PATH = Path(slow_log_path)
+
+
+def start_rerun(page):
+    _local.profile = RerunProfile(page)
+    return _local.profile
+
+
+def current_profile():
+    return getattr(_local, "profile", None)
+
+
+def checkpoint(name):
+    """Close the current section: time since the previous checkpoint is charged to ``name``."""
+    profile = current_profile()
+    if profile is not None:
+        profile.checkpoint(name)
+
+# -------------------------------
+# 🐢 Slow Log
+# -------------------------------
+def _write_slow_log(entry):
+    entry["logged_at"] = time.strftime("%Y-%m-%dT%H:%M:%S")
+    with _log_lock:
+        SLOW_LOG_PATH.parent.mkdir(parents=True, exist_ok=True)
+        with open(SLOW_LOG_PATH, "a") as f:
+            f.write(json.dumps(entry) + "\n")
+
+
+def _short_sql(query):
+    return re.sub(r"\s+", " ", query).strip()[:200]
+
+
+def record_query(query, wait_seconds, exec_seconds, rows):
+    """Called by db.run_query / db.TimedCursor for every statement (connection wait and execution split out)."""
+    entry = {
+        "sql": _short_sql(query),
+        "wait_ms": round(wait_seconds * 1000, 2),
+        "exec_ms": round(exec_seconds * 1000, 2),
+        "rows": rows,
+    }
+    profile = current_profile()
+    if profile is not None:
+        profile.queries.append(entry)
+    if entry["wait_ms"] + entry["exec_ms"] >= SLOW_QUERY_MS:
+        _write_slow_log({"kind": "query", "page": profile.page if profile else None, **entry})
+
+
+def finish_rerun():
+    profile = current_profile()
+    if profile is None:
+        return None
+    _local.profile = None
+    if profile.total_ms >= SLOW_RERUN_MS:
+        _write_slow_log({
+            "kind": "rerun",
+            "page": profile.page,
+            "total_ms": profile.total_ms,
+            "sections": profile.sections,
+            "queries": len(profile.queries),
+        })
+    return profile
+
+# -------------------------------
+# 🐞 Sidebar Debug Panel
+# -------------------------------
+def render_debug_panel(profile):
+    with st.sidebar.expander("🐞 Timing Breakdown", expanded=True):
+        query_ms = sum(q["wait_ms"] + q["exec_ms"] for q in profile.queries)
+        st.caption(f"Rerun {profile.total_ms:,.0f} ms · {len(profile.queries)} queries ({query_ms:,.0f} ms)")
+        if profile.sections:
+            st.dataframe(pd.DataFrame(profile.sections).set_index("section"), use_container_width=True)
+        if profile.queries:
+            st.dataframe(pd.DataFrame(profile.queries), use_container_width=True)
+        st.caption(f"Slow log: {SLOW_LOG_PATH} (query ≥ {SLOW_QUERY_MS} ms, rerun ≥ {SLOW_RERUN_MS} ms)")
@@ -0,0 +1,41 @@
+"""Apply pending SQL migrations from migrations/ in filename order.
+
+Usage: streamlit secrets must be configured, then run ``python migrate.py``.
+"""
+from pathlib import Path
+
+from db import get_connection
+
+MIGRATIONS_DIR = Path(__file__).parent / "migrations"
+
+# -------------------------------
+# 🛠️ Migration Runner
+# -------------------------------
+def applied_migrations(cursor):
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS schema_migrations (
+            name TEXT PRIMARY KEY,
+            applied_at TIMESTAMPTZ NOT NULL DEFAULT now()
+        )
+    """)
+    cursor.execute("SELECT name FROM schema_migrations")
+    return {row[0] for row in cursor.fetchall()}
+
+
+def run_migrations():
+    applied = []
+    with get_connection() as conn:
+        with conn.cursor() as cursor:
+            done = applied_migrations(cursor)
+            for path in sorted(MIGRATIONS_DIR.glob("*.sql")):
+                if path.name in done:
+                    continue
+                cursor.execute(path.read_text())
+                cursor.execute("INSERT INTO schema_migrations (name) VALUES (%s)", (path.name,))
+                applied.append(path.name)
+    return applied
+
+
+if __name__ == "__main__":
+    names = run_migrations()
+    print("\n".join(f"✅ applied {name}" for name in names) or "✅ schema up to date")
@@ -0,0 +1,27 @@
+-- Base trades table (no-op on existing installs); lets a fresh database, e.g. for benchmarks, be built from migrations
+CREATE TABLE IF NOT EXISTS trades (
+    id SERIAL PRIMARY KEY,
+    trade_date DATE NOT NULL,
+    trade_time TIME,
+    strategy TEXT,
+    stock_symbol TEXT,
+    position_type TEXT,
+    shares INTEGER,
+    buy_price NUMERIC(12, 2),
+    sell_price NUMERIC(12, 2),
+    stop_loss_price NUMERIC(12, 2),
+    premarket_news TEXT,
+    emotion TEXT,
+    net_gain_loss NUMERIC(12, 2),
+    return_win NUMERIC(12, 2),
+    return_loss NUMERIC(12, 2),
+    return_percent NUMERIC(12, 2),
+    return_percent_loss NUMERIC(12, 2),
+    total_investment NUMERIC(14, 2),
+    fees NUMERIC(10, 2),
+    gross_return NUMERIC(12, 2),
+    win_flag BOOLEAN,
+    ira_trade BOOLEAN,
+    paper_trade BOOLEAN,
+    ondemand_trade BOOLEAN
+);
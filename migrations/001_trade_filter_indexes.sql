@@ -0,0 +1,6 @@
+-- Indexes backing the dashboard's date-range / trade-type / strategy / symbol filters
+CREATE INDEX IF NOT EXISTS idx_trades_date_time ON trades (trade_date, trade_time);
+CREATE INDEX IF NOT EXISTS idx_trades_paper_date ON trades (trade_date, trade_time) WHERE paper_trade;
+CREATE INDEX IF NOT EXISTS idx_trades_ondemand_date ON trades (trade_date, trade_time) WHERE ondemand_trade;
+CREATE INDEX IF NOT EXISTS idx_trades_strategy_date ON trades (strategy, trade_date);
+CREATE INDEX IF NOT EXISTS idx_trades_symbol_date ON trades (stock_symbol, trade_date);
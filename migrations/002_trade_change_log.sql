@@ -0,0 +1,51 @@
+-- Data version + change log so the app can refresh cached trade frames incrementally
+CREATE TABLE IF NOT EXISTS trade_data_version (
+    id BOOLEAN PRIMARY KEY DEFAULT TRUE CHECK (id),
+    version BIGINT NOT NULL DEFAULT 0
+);
+INSERT INTO trade_data_version (id, version) VALUES (TRUE, 0) ON CONFLICT DO NOTHING;
+
+CREATE TABLE IF NOT EXISTS trade_changes (
+    version BIGINT NOT NULL,
+    trade_id BIGINT NOT NULL,
+    op CHAR(1) NOT NULL,            -- I(nsert) / U(pdate) / D(elete) / T(runcate)
+    changed_at TIMESTAMPTZ NOT NULL DEFAULT now()
+);
+CREATE INDEX IF NOT EXISTS idx_trade_changes_version ON trade_changes (version);
+CREATE INDEX IF NOT EXISTS idx_trade_changes_changed_at ON trade_changes (changed_at);
+
+CREATE OR REPLACE FUNCTION log_trade_changes() RETURNS trigger AS $$
+DECLARE
+    new_version BIGINT;
+BEGIN
+    UPDATE trade_data_version SET version = version + 1 RETURNING version INTO new_version;
+
+    IF TG_OP = 'INSERT' THEN
+        INSERT INTO trade_changes (version, trade_id, op) SELECT new_version, id, 'I' FROM new_rows;
+    ELSIF TG_OP = 'UPDATE' THEN
+        INSERT INTO trade_changes (version, trade_id, op) SELECT new_version, id, 'U' FROM new_rows;
+    ELSIF TG_OP = 'DELETE' THEN
+        INSERT INTO trade_changes (version, trade_id, op) SELECT new_version, id, 'D' FROM old_rows;
+    ELSE
+        INSERT INTO trade_changes (version, trade_id, op) VALUES (new_version, 0, 'T');
+    END IF;
+
+    -- Readers fall back to a full reload after 12h, so a day of history is plenty
+    DELETE FROM trade_changes WHERE changed_at < now() - interval '1 day';
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS trades_log_insert ON trades;
+DROP TRIGGER IF EXISTS trades_log_update ON trades;
+DROP TRIGGER IF EXISTS trades_log_delete ON trades;
+DROP TRIGGER IF EXISTS trades_log_truncate ON trades;
+
+CREATE TRIGGER trades_log_insert AFTER INSERT ON trades
+    REFERENCING NEW TABLE AS new_rows FOR EACH STATEMENT EXECUTE FUNCTION log_trade_changes();
+CREATE TRIGGER trades_log_update AFTER UPDATE ON trades
+    REFERENCING NEW TABLE AS new_rows FOR EACH STATEMENT EXECUTE FUNCTION log_trade_changes();
+CREATE TRIGGER trades_log_delete AFTER DELETE ON trades
+    REFERENCING OLD TABLE AS old_rows FOR EACH STATEMENT EXECUTE FUNCTION log_trade_changes();
+CREATE TRIGGER trades_log_truncate AFTER TRUNCATE ON trades
+    FOR EACH STATEMENT EXECUTE FUNCTION log_trade_changes();
@@ -0,0 +1,60 @@
+-- Per-day rollup feeding Summary, Key Stats, Profit by Strategy and Monthly Profit
+CREATE TABLE IF NOT EXISTS trade_daily_rollup (
+    trade_date DATE NOT NULL,
+    strategy TEXT NOT NULL,
+    paper_trade BOOLEAN NOT NULL,
+    ondemand_trade BOOLEAN NOT NULL,
+    trade_count INTEGER NOT NULL,
+    win_count INTEGER NOT NULL,
+    net_gain_loss NUMERIC NOT NULL,
+    PRIMARY KEY (trade_date, strategy, paper_trade, ondemand_trade)
+);
+
+CREATE OR REPLACE FUNCTION rebuild_trade_rollup(dates DATE[]) RETURNS void AS $$
+BEGIN
+    DELETE FROM trade_daily_rollup WHERE trade_date = ANY(dates);
+    INSERT INTO trade_daily_rollup (trade_date, strategy, paper_trade, ondemand_trade, trade_count, win_count, net_gain_loss)
+    SELECT trade_date,
+           COALESCE(strategy, ''),
+           COALESCE(paper_trade, FALSE),
+           COALESCE(ondemand_trade, FALSE),
+           COUNT(*),
+           COUNT(*) FILTER (WHERE win_flag),
+           COALESCE(SUM(net_gain_loss), 0)
+    FROM trades
+    WHERE trade_date = ANY(dates)
+    GROUP BY 1, 2, 3, 4;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION refresh_trade_rollup() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        PERFORM rebuild_trade_rollup(ARRAY(SELECT DISTINCT trade_date FROM new_rows));
+    ELSIF TG_OP = 'UPDATE' THEN
+        PERFORM rebuild_trade_rollup(ARRAY(SELECT trade_date FROM new_rows UNION SELECT trade_date FROM old_rows));
+    ELSIF TG_OP = 'DELETE' THEN
+        PERFORM rebuild_trade_rollup(ARRAY(SELECT DISTINCT trade_date FROM old_rows));
+    ELSE
+        TRUNCATE trade_daily_rollup;
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS trades_rollup_insert ON trades;
+DROP TRIGGER IF EXISTS trades_rollup_update ON trades;
+DROP TRIGGER IF EXISTS trades_rollup_delete ON trades;
+DROP TRIGGER IF EXISTS trades_rollup_truncate ON trades;
+
+CREATE TRIGGER trades_rollup_insert AFTER INSERT ON trades
+    REFERENCING NEW TABLE AS new_rows FOR EACH STATEMENT EXECUTE FUNCTION refresh_trade_rollup();
+CREATE TRIGGER trades_rollup_update AFTER UPDATE ON trades
+    REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows FOR EACH STATEMENT EXECUTE FUNCTION refresh_trade_rollup();
+CREATE TRIGGER trades_rollup_delete AFTER DELETE ON trades
+    REFERENCING OLD TABLE AS old_rows FOR EACH STATEMENT EXECUTE FUNCTION refresh_trade_rollup();
+CREATE TRIGGER trades_rollup_truncate AFTER TRUNCATE ON trades
+    FOR EACH STATEMENT EXECUTE FUNCTION refresh_trade_rollup();
+
+-- Backfill existing history
+SELECT rebuild_trade_rollup(ARRAY(SELECT DISTINCT trade_date FROM trades));
@@ -0,0 +1,6 @@
+-- Symbol universe for the stock scanner (alternative to the built-in SYMBOLS list)
+CREATE TABLE IF NOT EXISTS scanner_universe (
+    symbol TEXT PRIMARY KEY,
+    active BOOLEAN NOT NULL DEFAULT TRUE,
+    added_at TIMESTAMPTZ NOT NULL DEFAULT now()
+);
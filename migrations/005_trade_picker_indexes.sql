@@ -0,0 +1,3 @@
+-- Keyset pagination (newest first) and symbol prefix search for the delete picker
+CREATE INDEX IF NOT EXISTS idx_trades_date_id ON trades (trade_date, id);
+CREATE INDEX IF NOT EXISTS idx_trades_symbol_prefix ON trades (stock_symbol text_pattern_ops);
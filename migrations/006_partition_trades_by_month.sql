@@ -0,0 +1,96 @@
+-- Convert trades into a trade_date RANGE-partitioned table with one partition per month.
+-- Date filters are sent as literals, so Postgres prunes partitions at plan time.
+
+CREATE OR REPLACE FUNCTION ensure_trade_partition(month DATE) RETURNS void AS $$
+DECLARE
+    start_date DATE := date_trunc('month', month)::date;
+    part TEXT := 'trades_' || to_char(date_trunc('month', month), '"y"YYYY"m"MM');
+BEGIN
+    IF to_regclass(part) IS NULL THEN
+        EXECUTE format(
+            'CREATE TABLE %I PARTITION OF trades FOR VALUES FROM (%L) TO (%L)',
+            part, start_date, (start_date + interval '1 month')::date
+        );
+    END IF;
+EXCEPTION WHEN duplicate_table THEN
+    NULL;  -- created concurrently by another session
+END;
+$$ LANGUAGE plpgsql;
+
+ALTER TABLE trades RENAME TO trades_unpartitioned;
+
+CREATE TABLE trades (LIKE trades_unpartitioned INCLUDING DEFAULTS) PARTITION BY RANGE (trade_date);
+ALTER TABLE trades ALTER COLUMN trade_date SET NOT NULL;
+ALTER TABLE trades ADD PRIMARY KEY (id, trade_date);
+
+SELECT ensure_trade_partition(month::date)
+FROM generate_series(
+    date_trunc('month', (SELECT COALESCE(MIN(trade_date), current_date) FROM trades_unpartitioned)),
+    date_trunc('month', GREATEST((SELECT MAX(trade_date) FROM trades_unpartitioned), current_date + 90)),
+    interval '1 month'
+) AS month;
+
+INSERT INTO trades SELECT * FROM trades_unpartitioned;
+
+-- Keep the id sequence alive when the old table goes away
+DO $$
+DECLARE
+    seq TEXT := pg_get_serial_sequence('trades_unpartitioned', 'id');
+BEGIN
+    IF seq IS NOT NULL THEN
+        EXECUTE format('ALTER SEQUENCE %s OWNED BY trades.id', seq);
+    END IF;
+END;
+$$;
+
+DROP TABLE trades_unpartitioned;
+
+-- Indexes from 001 / 005, now created per partition through the parent
+CREATE INDEX IF NOT EXISTS idx_trades_date_time ON trades (trade_date, trade_time);
+CREATE INDEX IF NOT EXISTS idx_trades_paper_date ON trades (trade_date, trade_time) WHERE paper_trade;
+CREATE INDEX IF NOT EXISTS idx_trades_ondemand_date ON trades (trade_date, trade_time) WHERE ondemand_trade;
+CREATE INDEX IF NOT EXISTS idx_trades_strategy_date ON trades (strategy, trade_date);
+CREATE INDEX IF NOT EXISTS idx_trades_symbol_date ON trades (stock_symbol, trade_date);
+CREATE INDEX IF NOT EXISTS idx_trades_date_id ON trades (trade_date, id);
+CREATE INDEX IF NOT EXISTS idx_trades_symbol_prefix ON trades (stock_symbol text_pattern_ops);
+
+-- Change-log (002) and rollup (003) triggers, re-attached to the partitioned table
+CREATE TRIGGER trades_log_insert AFTER INSERT ON trades
+    REFERENCING NEW TABLE AS new_rows FOR EACH STATEMENT EXECUTE FUNCTION log_trade_changes();
+CREATE TRIGGER trades_log_update AFTER UPDATE ON trades
+    REFERENCING NEW TABLE AS new_rows FOR EACH STATEMENT EXECUTE FUNCTION log_trade_changes();
+CREATE TRIGGER trades_log_delete AFTER DELETE ON trades
+    REFERENCING OLD TABLE AS old_rows FOR EACH STATEMENT EXECUTE FUNCTION log_trade_changes();
+CREATE TRIGGER trades_log_truncate AFTER TRUNCATE ON trades
+    FOR EACH STATEMENT EXECUTE FUNCTION log_trade_changes();
+
+CREATE TRIGGER trades_rollup_insert AFTER INSERT ON trades
+    REFERENCING NEW TABLE AS new_rows FOR EACH STATEMENT EXECUTE FUNCTION refresh_trade_rollup();
+CREATE TRIGGER trades_rollup_update AFTER UPDATE ON trades
+    REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows FOR EACH STATEMENT EXECUTE FUNCTION refresh_trade_rollup();
+CREATE TRIGGER trades_rollup_delete AFTER DELETE ON trades
+    REFERENCING OLD TABLE AS old_rows FOR EACH STATEMENT EXECUTE FUNCTION refresh_trade_rollup();
+CREATE TRIGGER trades_rollup_truncate AFTER TRUNCATE ON trades
+    FOR EACH STATEMENT EXECUTE FUNCTION refresh_trade_rollup();
+
+-- Dropping a month skips row triggers, so fix up the rollup and force cache reloads here
+CREATE OR REPLACE FUNCTION drop_trade_month(month DATE) RETURNS BOOLEAN AS $$
+DECLARE
+    start_date DATE := date_trunc('month', month)::date;
+    part TEXT := 'trades_' || to_char(date_trunc('month', month), '"y"YYYY"m"MM');
+    new_version BIGINT;
+BEGIN
+    IF to_regclass(part) IS NULL THEN
+        RETURN FALSE;
+    END IF;
+    EXECUTE format('DROP TABLE %I', part);
+    DELETE FROM trade_daily_rollup WHERE trade_date >= start_date AND trade_date < start_date + interval '1 month';
+    UPDATE trade_data_version SET version = version + 1 RETURNING version INTO new_version;
+    INSERT INTO trade_changes (version, trade_id, op) VALUES (new_version, 0, 'T');
+    RETURN TRUE;
+END;
+$$ LANGUAGE plpgsql;
+
+-- Cached frames were built against the old table; make every reader reload once
+UPDATE trade_data_version SET version = version + 1;
+INSERT INTO trade_changes (version, trade_id, op) SELECT version, 0, 'T' FROM trade_data_version;
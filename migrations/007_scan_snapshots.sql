@@ -0,0 +1,24 @@
+-- Timestamped scanner snapshots written by scan_worker.py; the scanner page only reads these.
+-- Every scanned symbol is stored (not just matches) so the page can apply its own rule set.
+CREATE TABLE IF NOT EXISTS scan_runs (
+    id BIGSERIAL PRIMARY KEY,
+    started_at TIMESTAMPTZ NOT NULL,
+    finished_at TIMESTAMPTZ NOT NULL DEFAULT now(),
+    symbols INTEGER NOT NULL,
+    errors INTEGER NOT NULL DEFAULT 0
+);
+
+CREATE INDEX IF NOT EXISTS idx_scan_runs_finished ON scan_runs (finished_at DESC);
+
+CREATE TABLE IF NOT EXISTS scan_results (
+    run_id BIGINT NOT NULL REFERENCES scan_runs (id) ON DELETE CASCADE,
+    symbol TEXT NOT NULL,
+    price NUMERIC,
+    percent_change NUMERIC,
+    prev_close NUMERIC,
+    volume BIGINT,
+    market_cap NUMERIC,
+    float_shares NUMERIC,
+    error TEXT,
+    PRIMARY KEY (run_id, symbol)
+);
@@ -0,0 +1,5 @@
+-- Trades entered by hand kept the symbol as typed ("aapl", "Aapl "); the filters and picker
+-- compare upper-case, so backfill to match what insert_trade and the CSV import now store.
+UPDATE trades
+SET stock_symbol = upper(btrim(stock_symbol))
+WHERE stock_symbol IS DISTINCT FROM upper(btrim(stock_symbol));
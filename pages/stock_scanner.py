@@ -1,64 +1,81 @@
 
 import streamlit as st
 import pandas as pd
-import requests
+import json
 import time
 
-# -------------------------------------
-# 🔐 Load API Key from secrets
-# -------------------------------------
-API_KEY = st.secrets["finnhub_api_key"]
+from quote_stream import QuoteStream, StreamMatches, FINNHUB_WS_URL
+from scan_snapshots import fetch_runs, fetch_snapshot, diff_matches
+from screener import DEFAULT_RULE_SET, SYMBOLS, screen, passes, load_rule_set
 
 # -------------------------------------
-# 🔎 Predefined Tickers List (Top Volume/Momentum Symbols)
-# Replace with dynamic source later if needed
+# 🔐 Load Settings from secrets
 # -------------------------------------
-SYMBOLS = [
-    "TSLA", "NVDA", "AMD", "AAPL", "BAOS", "FRGT", "YHC", "MARA", "RIOT", "PLTR",
-    "SPY", "GME", "AMC", "BBAI", "CVNA", "TQQQ", "SOUN", "FFIE", "NKLA", "GOEV"
-]
+# Scans run in scan_worker.py; the key is only needed here for live streaming
+API_KEY = st.secrets.get("finnhub_api_key")
+WS_URL = st.secrets.get("finnhub_ws_url", FINNHUB_WS_URL)
+SNAPSHOT_POLL_SECONDS = int(st.secrets.get("scan_poll_seconds", 30))
+HISTORY_RUNS = 20
 
 # -------------------------------------
-# 📥 Fetch Finnhub Quote & Profile Data
+# 📸 Scan Snapshots (written by scan_worker.py)
 # -------------------------------------
-def fetch_stock_data(symbol):
-    try:
-        quote_url = f"https://finnhub.io/api/v1/quote?symbol={symbol}&token={API_KEY}"
-        profile_url = f"https://finnhub.io/api/v1/stock/profile2?symbol={symbol}&token={API_KEY}"
-
-        quote = requests.get(quote_url).json()
-        profile = requests.get(profile_url).json()
-
-        current_price = quote.get("c")
-        previous_close = quote.get("pc")
-        percent_change = round(((current_price - previous_close) / previous_close) * 100, 2) if previous_close else 0
-
-        return {
-            "Symbol": symbol,
-            "Price": current_price,
-            "% Change": percent_change,
-            "Volume": quote.get("v"),
-            "Market Cap": profile.get("marketCapitalization", 0),
-            "Float": profile.get("shareOutstanding", 0)
-        }
-
-    except Exception as e:
-        return {"Symbol": symbol, "Error": str(e)}
+@st.cache_data(ttl=SNAPSHOT_POLL_SECONDS, show_spinner=False)
+def cached_runs(limit):
+    # Shared by every session: one small query per poll interval, however many tabs are open
+    return fetch_runs(limit)
+
+
+@st.cache_data(max_entries=2 * HISTORY_RUNS, show_spinner=False)
+def cached_run_rows(run_id):
+    # A run's rows never change once written, so no TTL; a new run costs one query
+    return fetch_snapshot([run_id])
+
+
+def cached_snapshot(run_ids):
+    return pd.concat([cached_run_rows(int(run_id)) for run_id in run_ids], ignore_index=True)
+
+
+def run_matches(snapshot, run_id, rule_set):
+    rows = snapshot[(snapshot["run_id"] == run_id) & snapshot["Error"].isna()].drop(columns=["run_id", "Error"])
+    return screen(rows, rule_set)
 
 # -------------------------------------
-# 🧠 Filtering Logic
+# 🧠 Screening Rules (sidebar)
 # -------------------------------------
-def meets_criteria(stock):
-    try:
-        return (
-            stock["Price"] is not None and 1 <= stock["Price"] <= 20 and
-            stock["% Change"] > 10 and
-            stock.get("Volume", 0) >= 1_000_000 and
-            stock.get("Float", 9999) <= 20 and
-            stock.get("Market Cap", 9999) <= 500
-        )
-    except:
-        return False
+def rule_set_editor():
+    st.sidebar.markdown("### 📐 Screening Rules")
+    uploaded_rules = st.sidebar.file_uploader("Rule set (JSON)", type="json")
+    if uploaded_rules is not None:
+        try:
+            return load_rule_set(uploaded_rules)
+        except ValueError as e:  # includes json.JSONDecodeError
+            st.sidebar.error(f"❌ Invalid rule set: {e}")
+
+    defaults = {(rule["column"], rule["op"]): rule["value"] for rule in DEFAULT_RULE_SET["rules"]}
+    price_min = st.sidebar.number_input("Min Price ($)", value=float(defaults[("Price", ">=")]))
+    price_max = st.sidebar.number_input("Max Price ($)", value=float(defaults[("Price", "<=")]))
+    change_min = st.sidebar.number_input("Min % Change", value=float(defaults[("% Change", ">")]))
+    volume_min = st.sidebar.number_input("Min Volume", value=int(defaults[("Volume", ">=")]), step=100_000)
+    float_max = st.sidebar.number_input("Max Float (M shares)", value=float(defaults[("Float", "<=")]))
+    market_cap_max = st.sidebar.number_input("Max Market Cap ($M)", value=float(defaults[("Market Cap", "<=")]))
+    sort_by = st.sidebar.selectbox("Rank by", ["% Change", "Volume", "Price", "Float", "Market Cap"])
+    ascending = st.sidebar.checkbox("Ascending", value=False)
+    limit = st.sidebar.number_input("Show top N (0 = all)", value=0, min_value=0, step=5)
+
+    return {
+        "rules": [
+            {"column": "Price", "op": ">=", "value": price_min},
+            {"column": "Price", "op": "<=", "value": price_max},
+            {"column": "% Change", "op": ">", "value": change_min},
+            {"column": "Volume", "op": ">=", "value": volume_min},
+            {"column": "Float", "op": "<=", "value": float_max},
+            {"column": "Market Cap", "op": "<=", "value": market_cap_max},
+        ],
+        "sort_by": sort_by,
+        "ascending": ascending,
+        "limit": int(limit) or None,
+    }
 
 # -------------------------------------
 # 📊 Streamlit UI
@@ -66,26 +83,101 @@ def meets_criteria(stock):
 st.set_page_config(page_title="🧠 Auto Stock Scanner", layout="wide")
 st.title("🧠 Auto-Filtered Stock Scanner (Free Tier Friendly)")
 
-st.info("Scanning selected symbols with real-time quote and profile filters...")
-
-results = []
-count = 0
-
-for symbol in SYMBOLS:
-    stock = fetch_stock_data(symbol)
-    if meets_criteria(stock):
-        results.append(stock)
-
-    # Respect Finnhub's free tier limit (60 requests/min = 1 request/sec)
-    count += 2
-    if count >= 58:
-        st.warning("⏳ API limit hit, stopping scan early.")
-        break
-    time.sleep(1)  # 1 sec delay between API hits
-
-if results:
-    df = pd.DataFrame(results)
-    st.success(f"✅ Found {len(df)} stocks matching your criteria.")
-    st.dataframe(df, use_container_width=True)
-else:
-    st.warning("🚫 No stocks matched the filter at this time.")
+rule_set = rule_set_editor()
+runs = cached_runs(HISTORY_RUNS)
+history = cached_snapshot(tuple(runs["id"])) if not runs.empty else None
+
+# -------------------------------------
+# 📡 Live Streaming Mode
+# -------------------------------------
+@st.cache_resource
+def get_quote_stream():
+    # One websocket per process, seeded from the latest snapshot so % change has a prior close
+    stream = QuoteStream(f"{WS_URL}?token={API_KEY}")
+    stream.subscribe(SYMBOLS)
+    if history is not None:
+        latest = history[(history["run_id"] == runs["id"].iloc[0]) & history["Error"].isna()]
+        for stock in latest.drop(columns=["run_id", "Error"]).to_dict("records"):
+            stock = {key: value for key, value in stock.items() if not pd.isna(value)}
+            stream.seed(stock, stock.get("Prev Close"))
+    return stream.start()
+
+
+@st.fragment(run_every=2)
+def live_matches(stream, rule_set):
+    status = "🟢 Connected" if stream.connected else "🟠 Connecting..."
+    updated = time.strftime("%H:%M:%S", time.localtime(stream.updated_at)) if stream.updated_at else "—"
+    st.caption(f"{status} · last update {updated}")
+    # The stream is shared by all sessions; matching against this viewer's rules happens here
+    rules_key = json.dumps(rule_set, sort_keys=True)
+    if st.session_state.get("live_rules_key") != rules_key:
+        st.session_state["live_rules_key"] = rules_key
+        st.session_state["live_matches"] = StreamMatches(lambda stock: passes(stock, rule_set))
+    matches = st.session_state["live_matches"].update(stream)
+    if matches:
+        st.success(f"✅ {len(matches)} stocks currently match your criteria.")
+        ranked, _ = screen(pd.DataFrame(matches), rule_set)
+        st.dataframe(ranked, use_container_width=True)
+    else:
+        st.warning("🚫 No stocks match the filter right now.")
+
+
+if API_KEY and st.toggle("📡 Live streaming mode"):
+    stream = get_quote_stream()
+    stream.subscribe(history["Symbol"].unique() if history is not None else SYMBOLS)
+    live_matches(stream, rule_set)
+    st.stop()
+
+# -------------------------------------
+# 📸 Latest Snapshot, Diff & History
+# -------------------------------------
+@st.fragment(run_every=SNAPSHOT_POLL_SECONDS)
+def snapshot_view(rule_set):
+    runs = cached_runs(HISTORY_RUNS)
+    if runs.empty:
+        st.info("📭 No scan snapshots yet. Start the worker with `python scan_worker.py`.")
+        return
+    history = cached_snapshot(tuple(runs["id"]))
+    latest = runs.iloc[0]
+    age_minutes = (pd.Timestamp.now(tz="UTC") - latest["finished_at"]).total_seconds() / 60
+    st.caption(
+        f"📸 Snapshot #{latest['id']} · {latest['finished_at'].tz_convert(None):%Y-%m-%d %H:%M:%S} UTC "
+        f"({age_minutes:.0f} min ago) · {latest['symbols']} symbols"
+    )
+
+    errors = history[(history["run_id"] == latest["id"]) & history["Error"].notna()]
+    if not errors.empty:
+        st.warning(f"⚠️ {len(errors)} symbols failed: {', '.join(errors['Symbol'])}")
+
+    df, failures = run_matches(history, latest["id"], rule_set)
+    if not df.empty:
+        st.success(f"✅ Found {len(df)} stocks matching your criteria.")
+        st.dataframe(df, use_container_width=True, hide_index=True)
+    else:
+        st.warning("🚫 No stocks matched the filter at this time.")
+
+    # 🔀 What changed since the previous snapshot (under the current rules)
+    if len(runs) > 1:
+        previous, _ = run_matches(history, runs["id"].iloc[1], rule_set)
+        new, dropped, kept = diff_matches(df, previous)
+        st.subheader("🔀 Since Previous Snapshot")
+        col1, col2, col3 = st.columns(3)
+        col1.metric("New matches", len(new))
+        col2.metric("Dropped out", len(dropped))
+        col3.metric("Still matching", len(kept))
+        if new:
+            st.dataframe(df[df["Symbol"].isin(new)], use_container_width=True, hide_index=True)
+        if dropped:
+            st.caption(f"Dropped: {', '.join(dropped)}")
+
+    # 🕒 Match counts across recent snapshots
+    st.subheader("🕒 Snapshot History")
+    timeline = runs.assign(matches=[len(run_matches(history, run_id, rule_set)[0]) for run_id in runs["id"]])
+    st.line_chart(timeline.set_index("finished_at")["matches"])
+    st.dataframe(timeline, use_container_width=True, hide_index=True)
+
+    st.subheader("🧮 Rule Failures")
+    st.bar_chart(failures)
+
+
+snapshot_view(rule_set)
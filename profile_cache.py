@@ -0,0 +1,95 @@
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+
+DEFAULT_CACHE_PATH = Path(__file__).parent / ".cache" / "finnhub_profiles.sqlite"
+
+# Seconds each profile2 field stays fresh; anything not listed uses DEFAULT_FIELD_TTL
+FIELD_TTLS = {
+    "marketCapitalization": 24 * 3600,
+    "shareOutstanding": 7 * 24 * 3600,
+}
+DEFAULT_FIELD_TTL = 7 * 24 * 3600
+
+# -------------------------------------
+# 🗄️ On-disk Profile Cache (SQLite, per-field TTL)
+# -------------------------------------
+class ProfileCache:
+    """Caches Finnhub ``stock/profile2`` fields on disk.
+
+    Fresh fields are served directly; stale ones are served immediately while a
+    background thread refreshes them, so scans only block on unknown symbols.
+    """
+
+    def __init__(self, fetch_profile, path=DEFAULT_CACHE_PATH, field_ttls=None):
+        self.fetch_profile = fetch_profile
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.field_ttls = field_ttls or FIELD_TTLS
+        self._lock = threading.Lock()
+        self._refreshing = set()
+        with self._connect() as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS profile_fields (
+                    symbol TEXT NOT NULL,
+                    field TEXT NOT NULL,
+                    value TEXT,
+                    fetched_at REAL NOT NULL,
+                    PRIMARY KEY (symbol, field)
+                )
+            """)
+
+    def _connect(self):
+        return sqlite3.connect(self.path, timeout=10)
+
+    def _read(self, symbol):
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT field, value, fetched_at FROM profile_fields WHERE symbol = ?", (symbol,)
+            ).fetchall()
+        return {field: (json.loads(value), fetched_at) for field, value, fetched_at in rows}
+
+    def _write(self, symbol, profile):
+        now = time.time()
+        with self._lock, self._connect() as conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO profile_fields (symbol, field, value, fetched_at) VALUES (?, ?, ?, ?)",
+                [(symbol, field, json.dumps(profile.get(field)), now) for field in self.field_ttls],
+            )
+
+    def _is_fresh(self, field, fetched_at):
+        return time.time() - fetched_at < self.field_ttls.get(field, DEFAULT_FIELD_TTL)
+
+    def refresh(self, symbol):
+        profile = self.fetch_profile(symbol)
+        self._write(symbol, profile)
+        return {field: profile[field] for field in self.field_ttls if profile.get(field) is not None}
+
+    def _refresh_in_background(self, symbol):
+        with self._lock:
+            if symbol in self._refreshing:
+                return
+            self._refreshing.add(symbol)
+
+        def worker():
+            try:
+                self.refresh(symbol)
+            except Exception:
+                pass  # keep serving the stale value; next scan retries
+            finally:
+                with self._lock:
+                    self._refreshing.discard(symbol)
+
+        threading.Thread(target=worker, daemon=True).start()
+
+    def get(self, symbol):
+        cached = self._read(symbol)
+        if not all(field in cached for field in self.field_ttls):
+            return self.refresh(symbol)
+        if not all(self._is_fresh(field, fetched_at) for field, (_, fetched_at) in cached.items()):
+            self._refresh_in_background(symbol)
+        # Fields absent from the payload are cached as null (so they are not re-fetched) but left
+        # out here, so callers' ``.get(field, default)`` still applies (Finnhub sends {} for ETFs)
+        return {field: value for field, (value, _) in cached.items() if value is not None}
@@ -0,0 +1,145 @@
+import json
+import threading
+import time
+
+import websocket
+
+FINNHUB_WS_URL = "wss://ws.finnhub.io"
+
+# -------------------------------------
+# 📡 Streaming Quotes with Incremental Screening
+# -------------------------------------
+class QuoteStream:
+    """Keeps the latest state per symbol from a Finnhub-style trade websocket.
+
+    The stream is shared by every viewer, so it applies no filter itself: each
+    incoming batch updates only the symbols it mentions and stamps them with a
+    sequence number, and each viewer's ``StreamMatches`` re-screens just the
+    symbols changed since it last looked (see ``changes_since``).
+    Works against the real feed or a local fake (see fake_quote_feed.py).
+    """
+
+    def __init__(self, url, reconnect_delay=5):
+        self.url = url
+        self.reconnect_delay = reconnect_delay
+        self._lock = threading.Lock()
+        self._state = {}
+        self._previous_close = {}
+        self._sequence = 0
+        self._changed_at = {}
+        self._symbols = set()
+        self._ws = None
+        self._thread = None
+        self._stop = threading.Event()
+        self.updated_at = None
+        self.connected = False
+
+    # ---- state ----
+    def seed(self, stock, previous_close=None):
+        """Prime a symbol with REST data (profile fields, volume, prior close)."""
+        symbol = stock["Symbol"]
+        with self._lock:
+            self._state[symbol] = dict(stock)
+            if previous_close:
+                self._previous_close[symbol] = previous_close
+            self._mark_changed([symbol])
+
+    def _mark_changed(self, symbols):
+        self._sequence += 1
+        for symbol in symbols:
+            self._changed_at[symbol] = self._sequence
+
+    def _apply_trades(self, trades):
+        changed = set()
+        with self._lock:
+            for trade in trades:
+                symbol, price = trade.get("s"), trade.get("p")
+                if symbol not in self._symbols or price is None:
+                    continue
+                stock = self._state.setdefault(symbol, {"Symbol": symbol, "Volume": 0})
+                previous_close = self._previous_close.setdefault(symbol, price)
+                stock["Price"] = price
+                stock["% Change"] = round((price - previous_close) / previous_close * 100, 2) if previous_close else 0
+                stock["Volume"] = (stock.get("Volume") or 0) + (trade.get("v") or 0)
+                changed.add(symbol)
+            if changed:
+                self._mark_changed(changed)
+                self.updated_at = time.time()
+        return changed
+
+    def changes_since(self, sequence):
+        """Return (current sequence, copies of the stocks updated after ``sequence``)."""
+        with self._lock:
+            changed = [dict(self._state[symbol]) for symbol, seen in self._changed_at.items() if seen > sequence]
+            return self._sequence, changed
+
+    def snapshot(self):
+        with self._lock:
+            return [dict(stock) for stock in self._state.values()]
+
+    # ---- websocket ----
+    def subscribe(self, symbols):
+        new = set(symbols) - self._symbols
+        self._symbols |= new
+        if self._ws is not None and self.connected:
+            for symbol in new:
+                self._ws.send(json.dumps({"type": "subscribe", "symbol": symbol}))
+
+    def _on_open(self, ws):
+        self.connected = True
+        for symbol in list(self._symbols):
+            ws.send(json.dumps({"type": "subscribe", "symbol": symbol}))
+
+    def _on_message(self, ws, message):
+        payload = json.loads(message)
+        if payload.get("type") == "trade":
+            self._apply_trades(payload.get("data") or [])
+
+    def _on_close(self, ws, *args):
+        self.connected = False
+
+    def _run(self):
+        while not self._stop.is_set():
+            self._ws = websocket.WebSocketApp(
+                self.url, on_open=self._on_open, on_message=self._on_message, on_close=self._on_close,
+            )
+            self._ws.run_forever(ping_interval=20, ping_timeout=10)
+            self.connected = False
+            self._stop.wait(self.reconnect_delay)
+
+    def start(self):
+        if self._thread is None or not self._thread.is_alive():
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+        if self._ws is not None:
+            self._ws.close()
+
+
+# -------------------------------------
+# 🧑‍💻 Per-viewer Matches over a Shared Stream
+# -------------------------------------
+class StreamMatches:
+    """One viewer's ``criteria`` applied incrementally to a shared ``QuoteStream``.
+
+    Keep one per session (and rule set); ``update`` only re-screens symbols the
+    stream changed since the previous call.
+    """
+
+    def __init__(self, criteria):
+        self.criteria = criteria
+        self.sequence = 0
+        self._matches = {}
+
+    def update(self, stream):
+        self.sequence, changed = stream.changes_since(self.sequence)
+        for stock in changed:
+            if self.criteria(stock):
+                self._matches[stock["Symbol"]] = stock
+            else:
+                self._matches.pop(stock["Symbol"], None)
+        return list(self._matches.values())
@@ -0,0 +1,97 @@
+import pandas as pd
+
+from db import TimedCursor, get_connection, run_query
+
+# -------------------------------------
+# 🗂️ Scanner Snapshot Columns
+# -------------------------------------
+# scan_results column -> scanner display column (the keys screen() rules use)
+SNAPSHOT_COLUMNS = {
+    "symbol": "Symbol",
+    "price": "Price",
+    "percent_change": "% Change",
+    "prev_close": "Prev Close",
+    "volume": "Volume",
+    "market_cap": "Market Cap",
+    "float_shares": "Float",
+    "error": "Error",
+}
+NUMERIC_SNAPSHOT_COLUMNS = ["Price", "% Change", "Prev Close", "Volume", "Market Cap", "Float"]
+
+RUN_COLUMNS = ["id", "started_at", "finished_at", "symbols", "errors"]
+
+# -------------------------------------
+# 💾 Writing Snapshots (scan worker)
+# -------------------------------------
+def write_snapshot(started_at, stocks):
+    """Store one scan (the dicts from fetch_stock_data) as a run plus one row per symbol.
+
+    Returns the new run id. Rows are sent as arrays so a run is a single INSERT.
+    """
+    frame = pd.DataFrame(stocks).reindex(columns=list(SNAPSHOT_COLUMNS.values()))
+    frame = frame.drop_duplicates("Symbol")
+    frame["Error"] = frame["Error"].astype(object).where(frame["Error"].notna(), None)
+    arrays = [frame["Symbol"].astype(str).tolist(), frame["Error"].tolist()] + [
+        [None if pd.isna(value) else float(value) for value in frame[column]]
+        for column in NUMERIC_SNAPSHOT_COLUMNS
+    ]
+    with get_connection() as conn:
+        with conn.cursor(cursor_factory=TimedCursor) as cursor:
+            cursor.execute(
+                "INSERT INTO scan_runs (started_at, symbols, errors) VALUES (%s, %s, %s) RETURNING id",
+                (started_at, len(frame), int(frame["Error"].notna().sum())),
+            )
+            run_id = cursor.fetchone()[0]
+            cursor.execute(
+                """
+                INSERT INTO scan_results (
+                    run_id, symbol, error, price, percent_change, prev_close, volume, market_cap, float_shares
+                )
+                SELECT %s, r.symbol, r.error, r.price, r.percent_change, r.prev_close, r.volume::bigint, r.market_cap, r.float_shares
+                FROM unnest(
+                    %s::text[], %s::text[], %s::numeric[], %s::numeric[], %s::numeric[], %s::numeric[], %s::numeric[], %s::numeric[]
+                ) AS r(symbol, error, price, percent_change, prev_close, volume, market_cap, float_shares)
+                """,
+                (run_id, *arrays),
+            )
+    return run_id
+
+
+def prune_snapshots(keep_days):
+    """Delete runs (and their results, via cascade) older than ``keep_days``."""
+    deleted = run_query(
+        "DELETE FROM scan_runs WHERE finished_at < now() - make_interval(days => %s) RETURNING id",
+        (int(keep_days),),
+    )
+    return len(deleted or [])
+
+# -------------------------------------
+# 📖 Reading Snapshots (scanner page)
+# -------------------------------------
+def fetch_runs(limit=20):
+    """Most recent runs first."""
+    rows = run_query(
+        f"SELECT {', '.join(RUN_COLUMNS)} FROM scan_runs ORDER BY finished_at DESC, id DESC LIMIT %s",
+        (int(limit),),
+    )
+    return pd.DataFrame(rows or [], columns=RUN_COLUMNS)
+
+
+def fetch_snapshot(run_ids):
+    """Scanned rows for one or more runs, with display column names and a ``run_id`` column."""
+    columns = list(SNAPSHOT_COLUMNS)
+    rows = run_query(
+        f"SELECT run_id, {', '.join(columns)} FROM scan_results WHERE run_id = ANY(%s) ORDER BY run_id, symbol",
+        ([int(run_id) for run_id in run_ids],),
+    )
+    frame = pd.DataFrame(rows or [], columns=["run_id"] + columns).rename(columns=SNAPSHOT_COLUMNS)
+    frame[NUMERIC_SNAPSHOT_COLUMNS] = frame[NUMERIC_SNAPSHOT_COLUMNS].astype("float64")
+    return frame
+
+# -------------------------------------
+# 🔀 Snapshot Diff
+# -------------------------------------
+def diff_matches(current, previous):
+    """Compare two match frames by symbol: (new, dropped, still_matching) symbol lists."""
+    now, before = set(current["Symbol"]), set(previous["Symbol"])
+    return sorted(now - before), sorted(before - now), sorted(now & before)
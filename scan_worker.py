@@ -0,0 +1,120 @@
+"""Scan the symbol universe on a fixed interval and store timestamped snapshots.
+
+Usage:
+    python scan_worker.py --interval 300
+    python scan_worker.py --once --universe symbols.csv --dsn postgresql://localhost/trading
+
+The scanner page only reads the snapshots, so page loads never wait on Finnhub and
+API usage stays the same however many viewers are open. The Finnhub key comes from
+``--api-key``, ``FINNHUB_API_KEY`` or the ``finnhub_api_key`` secret; the database from
+``--dsn`` or the Streamlit secrets.
+
+Both this worker and the dashboard's candle fetch call Finnhub with the same key, each
+with its own rate limiter, so their limits must add up to the plan's quota: by default
+the worker takes 50/min and the dashboard ``finnhub_candle_calls_per_minute`` (10/min)
+of the free tier's 60.
+"""
+import argparse
+import os
+import sys
+import time
+from datetime import datetime, timezone
+
+from db import configure_pool, run_query
+from finnhub_client import FinnhubClient
+from profile_cache import ProfileCache
+from scan_snapshots import write_snapshot, prune_snapshots
+from screener import SYMBOLS, load_universe, load_universe_from_db
+
+# Free tier is 60/min; the rest is left for the dashboard's candle fetch (see module docstring)
+DEFAULT_CALLS_PER_MINUTE = 50
+
+# -------------------------------------
+# 📥 Fetch Finnhub Quote & Profile Data
+# -------------------------------------
+def fetch_stock_data(client, profiles, symbol):
+    try:
+        quote = client.quote(symbol)
+        profile = profiles.get(symbol)
+
+        current_price = quote.get("c")
+        previous_close = quote.get("pc")
+        percent_change = round(((current_price - previous_close) / previous_close) * 100, 2) if previous_close else 0
+
+        return {
+            "Symbol": symbol,
+            "Price": current_price,
+            "% Change": percent_change,
+            "Prev Close": previous_close,
+            "Volume": quote.get("v"),
+            "Market Cap": profile.get("marketCapitalization", 0),
+            "Float": profile.get("shareOutstanding", 0)
+        }
+
+    except Exception as e:
+        return {"Symbol": symbol, "Error": str(e)}
+
+
+def resolve_universe(path=None):
+    """Universe file if given, else the active scanner_universe rows, else the built-in list."""
+    if path:
+        return load_universe(path)
+    return load_universe_from_db(run_query) or SYMBOLS
+
+# -------------------------------------
+# 🔁 Scan Loop
+# -------------------------------------
+def scan_once(client, profiles, universe):
+    started_at = datetime.now(timezone.utc)
+    stocks = client.map_symbols(lambda symbol: fetch_stock_data(client, profiles, symbol), universe)
+    run_id = write_snapshot(started_at, stocks)
+    errors = sum("Error" in stock for stock in stocks)
+    elapsed = (datetime.now(timezone.utc) - started_at).total_seconds()
+    print(f"📸 run {run_id}: {len(stocks)} symbols, {errors} errors in {elapsed:.1f}s", file=sys.stderr)
+    return run_id
+
+
+def run_forever(client, profiles, interval, universe_path=None, keep_days=7):
+    while True:
+        started = time.monotonic()
+        try:
+            scan_once(client, profiles, resolve_universe(universe_path))
+            prune_snapshots(keep_days)
+        except Exception as e:
+            # A failed scan (DB blip, Finnhub outage) should not kill the worker
+            print(f"❌ scan failed: {e}", file=sys.stderr)
+        time.sleep(max(0.0, interval - (time.monotonic() - started)))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--interval", type=float, default=300, help="seconds between scan starts")
+    parser.add_argument("--once", action="store_true", help="run a single scan and exit")
+    parser.add_argument("--universe", help="CSV or one-symbol-per-line file (default: scanner_universe table)")
+    parser.add_argument("--keep-days", type=int, default=7, help="delete snapshots older than this")
+    parser.add_argument("--dsn", help="Postgres DSN (default: Streamlit secrets)")
+    parser.add_argument("--api-key", default=os.environ.get("FINNHUB_API_KEY"))
+    parser.add_argument("--calls-per-minute", type=int, default=DEFAULT_CALLS_PER_MINUTE,
+                        help="this worker's share of the Finnhub quota (the dashboard uses the rest)")
+    args = parser.parse_args(argv)
+
+    if args.dsn:
+        configure_pool(args.dsn)
+    api_key = args.api_key
+    if not api_key:
+        import streamlit as st
+        api_key = st.secrets["finnhub_api_key"]
+
+    # Only the scanner's share of the quota; the dashboard's candle fetch has its own limiter
+    client = FinnhubClient(api_key, per_minute=args.calls_per_minute)
+    profiles = ProfileCache(client.profile)
+
+    if args.once:
+        scan_once(client, profiles, resolve_universe(args.universe))
+        prune_snapshots(args.keep_days)
+    else:
+        run_forever(client, profiles, args.interval, args.universe, args.keep_days)
+
+
+if __name__ == "__main__":
+    main()
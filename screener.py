@@ -0,0 +1,143 @@
+import json
+import operator
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+# -------------------------------------
+# 📐 Rule Sets
+# -------------------------------------
+# A rule set is a list of {"column", "op", "value"} dicts plus optional ranking;
+# missing data never passes a rule (matches the old meets_criteria defaults).
+OPERATORS = {
+    ">=": operator.ge,
+    "<=": operator.le,
+    ">": operator.gt,
+    "<": operator.lt,
+    "==": operator.eq,
+    "!=": operator.ne,
+}
+
+# Columns produced by fetch_stock_data that rules may test or rank by
+SCREEN_COLUMNS = ["Price", "% Change", "Prev Close", "Volume", "Market Cap", "Float"]
+
+DEFAULT_RULE_SET = {
+    "rules": [
+        {"column": "Price", "op": ">=", "value": 1},
+        {"column": "Price", "op": "<=", "value": 20},
+        {"column": "% Change", "op": ">", "value": 10},
+        {"column": "Volume", "op": ">=", "value": 1_000_000},
+        {"column": "Float", "op": "<=", "value": 20},
+        {"column": "Market Cap", "op": "<=", "value": 500},
+    ],
+    "sort_by": "% Change",
+    "ascending": False,
+    "limit": None,
+}
+
+
+def rule_label(rule):
+    return f"{rule['column']} {rule['op']} {rule['value']:,}"
+
+
+def load_rule_set(source):
+    """Read and validate a rule set from a path or an open/uploaded JSON file."""
+    if hasattr(source, "read"):
+        rule_set = json.load(source)
+    else:
+        with open(source) as f:
+            rule_set = json.load(f)
+    return validate_rule_set(rule_set)
+
+
+def validate_rule_set(rule_set):
+    """Raise ValueError unless every rule uses a known column, operator and a numeric value."""
+    if not isinstance(rule_set, dict) or not isinstance(rule_set.get("rules"), list):
+        raise ValueError('Rule set must be an object with a "rules" list')
+    for i, rule in enumerate(rule_set["rules"], start=1):
+        if not isinstance(rule, dict):
+            raise ValueError(f"Rule {i} must be an object")
+        if rule.get("column") not in SCREEN_COLUMNS:
+            raise ValueError(f"Rule {i}: unknown column {rule.get('column')!r} (expected one of {', '.join(SCREEN_COLUMNS)})")
+        if rule.get("op") not in OPERATORS:
+            raise ValueError(f"Rule {i}: unknown operator {rule.get('op')!r} (expected one of {' '.join(OPERATORS)})")
+        if isinstance(rule.get("value"), bool) or not isinstance(rule.get("value"), (int, float)):
+            raise ValueError(f"Rule {i}: value must be a number")
+    if rule_set.get("sort_by") is not None and rule_set["sort_by"] not in SCREEN_COLUMNS:
+        raise ValueError(f"Unknown sort_by column {rule_set['sort_by']!r}")
+    limit = rule_set.get("limit")
+    if limit is not None and (isinstance(limit, bool) or not isinstance(limit, int) or limit < 0):
+        raise ValueError("limit must be a non-negative integer")
+    return rule_set
+
+# -------------------------------------
+# ⚡ Vectorized Screening
+# -------------------------------------
+def screen(df, rule_set=DEFAULT_RULE_SET):
+    """Evaluate ``rule_set`` over every row of ``df`` at once.
+
+    Returns (matches, failures): the ranked matching rows and a Series of how
+    many rows failed each rule.
+    """
+    passed = np.ones(len(df), dtype=bool)
+    failures = {}
+    for rule in rule_set["rules"]:
+        column = df[rule["column"]] if rule["column"] in df.columns else pd.Series(np.nan, index=df.index)
+        values = pd.to_numeric(column, errors="coerce").to_numpy(dtype="float64", na_value=np.nan)
+        with np.errstate(invalid="ignore"):
+            mask = OPERATORS[rule["op"]](values, rule["value"]) & ~np.isnan(values)
+        failures[rule_label(rule)] = int((~mask).sum())
+        passed &= mask
+
+    matches = df[passed]
+    if rule_set.get("sort_by") in matches.columns:
+        matches = matches.sort_values(rule_set["sort_by"], ascending=rule_set.get("ascending", False), kind="stable")
+    if rule_set.get("limit"):
+        matches = matches.head(rule_set["limit"])
+    return matches, pd.Series(failures, name="failed", dtype="int64")
+
+
+def passes(stock, rule_set=DEFAULT_RULE_SET):
+    """Scalar form of ``screen`` for a single stock dict (used by the live stream)."""
+    for rule in rule_set["rules"]:
+        value = stock.get(rule["column"])
+        if value is None or (isinstance(value, float) and np.isnan(value)):
+            return False
+        try:
+            if not OPERATORS[rule["op"]](value, rule["value"]):
+                return False
+        except TypeError:
+            return False
+    return True
+
+# -------------------------------------
+# 🌐 Universe Loading
+# -------------------------------------
+# 🔎 Predefined Tickers List (Top Volume/Momentum Symbols)
+# Default universe; a file or the scanner_universe table can replace it
+SYMBOLS = [
+    "TSLA", "NVDA", "AMD", "AAPL", "BAOS", "FRGT", "YHC", "MARA", "RIOT", "PLTR",
+    "SPY", "GME", "AMC", "BBAI", "CVNA", "TQQQ", "SOUN", "FFIE", "NKLA", "GOEV"
+]
+
+
+def load_universe(source):
+    """Read symbols from a CSV (``Symbol``/``symbol`` column) or a one-per-line text file."""
+    if hasattr(source, "read"):
+        name = getattr(source, "name", "")
+    else:
+        name = str(source)
+        source = Path(source)
+    if name.endswith(".csv"):
+        frame = pd.read_csv(source)
+        column = next((c for c in frame.columns if c.lower() == "symbol"), frame.columns[0])
+        symbols = frame[column]
+    else:
+        symbols = pd.read_csv(source, header=None, names=["symbol"])["symbol"]
+    symbols = symbols.dropna().astype(str).str.strip().str.upper()
+    return symbols[symbols != ""].drop_duplicates().tolist()
+
+
+def load_universe_from_db(run_query):
+    return [row[0] for row in run_query("SELECT symbol FROM scanner_universe WHERE active ORDER BY symbol")]
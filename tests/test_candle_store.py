@@ -0,0 +1,33 @@
+from datetime import date, datetime
+
+import numpy as np
+import pandas as pd
+
+from candle_store import MARKET_TZ, CandleStore, excursions
+from trades import TRADE_COLUMNS, compact_trades
+
+
+def make_trades(times):
+    rows = [
+        {**{col: None for col in TRADE_COLUMNS}, "trade_date": "2024-03-04", "trade_time": t, "stock_symbol": "AAA",
+         "strategy": "Scalp", "position_type": "Long", "shares": 100, "buy_price": 10.0, "sell_price": 10.5,
+         "stop_loss_price": 9.8}
+        for t in times
+    ]
+    frame = pd.DataFrame(rows)
+    frame.insert(0, "id", range(1, len(frame) + 1))
+    return compact_trades(frame)
+
+
+def test_blank_trade_time_gets_no_excursions(tmp_path):
+    store = CandleStore(tmp_path)
+    start = int(datetime(2024, 3, 4, 4, 0, tzinfo=MARKET_TZ).timestamp())
+    t = start + 60 * np.arange(16 * 60)
+    price = np.full(len(t), 10.0)
+    store.save("AAA", date(2024, 3, 4), {"s": "ok", "t": t, "o": price, "h": price + 0.6, "l": price - 0.1, "c": price, "v": price})
+
+    # Blank first: pandas must not infer the format from it and drop the timed rows
+    stats = excursions(make_trades([None, "09:45:00", "10:00:00"]), store)
+
+    assert stats["mae"].isna().tolist() == [True, False, False]
+    assert stats.loc[1:, "minutes_in_trade"].tolist() == [0.0, 0.0]
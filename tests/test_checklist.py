@@ -0,0 +1,42 @@
+import pandas as pd
+
+from checklist import DEFAULT_CHECKLIST_RULES, evaluate_days, violations, compliance_calendar
+from trades import TRADE_COLUMNS, compact_trades
+
+
+def make_trades(rows):
+    """Trades as fetch_trades returns them: DB rows, then compact_trades."""
+    defaults = {column: None for column in TRADE_COLUMNS}
+    defaults.update(strategy="Gap & Go", stock_symbol="AAPL", position_type="Long", shares=10, paper_trade=True)
+    frame = pd.DataFrame([{**defaults, **row} for row in rows])
+    frame.insert(0, "id", range(1, len(frame) + 1))
+    return compact_trades(frame)
+
+
+def test_missing_trade_time_counts_as_outside_window():
+    trades = make_trades([
+        {"trade_date": "2024-03-04", "trade_time": "09:45:00", "net_gain_loss": 50.0},
+        {"trade_date": "2024-03-04", "trade_time": None, "net_gain_loss": 25.0},
+        {"trade_date": "2024-03-05", "trade_time": "10:15:00", "net_gain_loss": -20.0},
+    ])
+
+    days = evaluate_days(trades, DEFAULT_CHECKLIST_RULES)
+
+    assert days["trades"].tolist() == [2, 1]
+    assert days["outside_window"].tolist() == [1, 0]
+    assert days["compliant"].tolist() == [False, True]
+    assert violations(days)["rule"].tolist() == ["Trading window"]
+    assert compliance_calendar(days).shape == (1, 5)
+
+
+def test_per_day_limits():
+    trades = make_trades(
+        [{"trade_date": "2024-03-04", "trade_time": "10:00:00", "net_gain_loss": -30.0}] * 5
+        + [{"trade_date": "2024-03-05", "trade_time": "11:00:00", "net_gain_loss": 250.0}]
+    )
+
+    days = evaluate_days(trades, {"max_trades_per_day": 4})
+
+    assert days["over_trade_limit"].tolist() == [True, False]
+    assert days["max_loss_hit"].tolist() == [True, False]
+    assert days["target_reached"].tolist() == [False, True]
@@ -0,0 +1,68 @@
+import time
+
+from psycopg2 import extensions
+
+import db
+
+
+class FakeConn:
+    def __init__(self, healthy):
+        self.healthy = healthy
+        self.closed = 0
+        self.info = type("Info", (), {"transaction_status": extensions.TRANSACTION_STATUS_IDLE})()
+
+    def cursor(self):
+        conn = self
+
+        class Cursor:
+            def __enter__(self):
+                return self
+
+            def __exit__(self, *exc):
+                return False
+
+            def execute(self, query):
+                if not conn.healthy:
+                    raise db.psycopg2.OperationalError("server closed the connection")
+
+        return Cursor()
+
+    def rollback(self):
+        pass
+
+
+class FakeThreadedPool:
+    def __init__(self, idle, fresh):
+        self.idle, self.fresh, self.closed = list(idle), fresh, []
+
+    def getconn(self):
+        return self.idle.pop(0) if self.idle else self.fresh
+
+    def putconn(self, conn, close=False):
+        if close:
+            self.closed.append(conn)
+        else:
+            self.idle.append(conn)
+
+
+def make_pool(idle, fresh):
+    conn_pool = db.ConnectionPool.__new__(db.ConnectionPool)
+    conn_pool._pool = FakeThreadedPool(idle, fresh)
+    conn_pool._slots = db.threading.BoundedSemaphore(3)
+    conn_pool._maxconn = 3
+    conn_pool._wait_timeout = 1
+    conn_pool._healthcheck_idle = 30
+    conn_pool._last_used = {}
+    return conn_pool
+
+
+def test_getconn_skips_every_stale_idle_connection():
+    stale = [FakeConn(healthy=False), FakeConn(healthy=False)]
+    fresh = FakeConn(healthy=True)
+    conn_pool = make_pool(stale, fresh)
+    for conn in stale:
+        conn_pool._last_used[id(conn)] = time.monotonic() - 60
+
+    assert conn_pool.getconn() is fresh
+    assert conn_pool._pool.closed == stale
+    assert not any(id(conn) in conn_pool._last_used for conn in stale)
@@ -0,0 +1,17 @@
+import pytest
+
+from finnhub_client import TokenBucket
+
+
+@pytest.mark.parametrize("per_minute, burst", [(2, None), (5, None), (10, 10), (60, None)])
+def test_bucket_always_refills(per_minute, burst):
+    bucket = TokenBucket(per_minute, burst)
+
+    assert 1 <= bucket.capacity < per_minute
+    assert bucket.rate > 0
+    assert bucket.capacity + bucket.rate * 60 == pytest.approx(per_minute)
+
+
+def test_bucket_rejects_quota_below_two():
+    with pytest.raises(ValueError):
+        TokenBucket(1)
@@ -0,0 +1,21 @@
+from profile_cache import ProfileCache
+
+
+def test_fields_missing_from_payload_fall_back_to_caller_defaults(tmp_path):
+    calls = []
+    cache = ProfileCache(lambda symbol: calls.append(symbol) or {}, path=tmp_path / "profiles.sqlite")
+
+    first = cache.get("SPY")
+    second = cache.get("SPY")
+
+    assert first == second == {}
+    assert second.get("marketCapitalization", 0) == 0
+    assert calls == ["SPY"]  # the empty payload is cached, not re-fetched
+
+
+def test_present_fields_are_cached(tmp_path):
+    cache = ProfileCache(lambda symbol: {"marketCapitalization": 120.5, "shareOutstanding": 8.2}, path=tmp_path / "p.sqlite")
+
+    cache.get("AAA")
+
+    assert cache.get("AAA") == {"marketCapitalization": 120.5, "shareOutstanding": 8.2}
@@ -0,0 +1,35 @@
+from quote_stream import QuoteStream, StreamMatches
+
+
+def make_stream():
+    stream = QuoteStream("ws://localhost:0")
+    stream.subscribe(["AAA", "BBB"])
+    stream.seed({"Symbol": "AAA", "Volume": 0}, previous_close=10.0)
+    stream.seed({"Symbol": "BBB", "Volume": 0}, previous_close=10.0)
+    return stream
+
+
+def test_viewers_with_different_rules_share_one_stream():
+    stream = make_stream()
+    loose = StreamMatches(lambda stock: stock.get("% Change", 0) > 5)
+    strict = StreamMatches(lambda stock: stock.get("% Change", 0) > 15)
+
+    stream._apply_trades([{"s": "AAA", "p": 11.0, "v": 100}, {"s": "BBB", "p": 12.0, "v": 100}])
+
+    assert sorted(s["Symbol"] for s in loose.update(stream)) == ["AAA", "BBB"]
+    assert [s["Symbol"] for s in strict.update(stream)] == ["BBB"]
+    # The strict viewer screening did not hide anything from the loose one
+    assert sorted(s["Symbol"] for s in loose.update(stream)) == ["AAA", "BBB"]
+
+
+def test_update_only_rescreens_changed_symbols():
+    stream = make_stream()
+    seen = []
+    viewer = StreamMatches(lambda stock: seen.append(stock["Symbol"]) or True)
+
+    viewer.update(stream)
+    seen.clear()
+    stream._apply_trades([{"s": "BBB", "p": 10.5, "v": 10}])
+    viewer.update(stream)
+
+    assert seen == ["BBB"]
@@ -0,0 +1,24 @@
+import io
+import json
+
+import pytest
+
+from screener import DEFAULT_RULE_SET, load_rule_set
+
+
+def test_load_rule_set_accepts_uploaded_file():
+    uploaded = io.BytesIO(json.dumps(DEFAULT_RULE_SET).encode())
+
+    assert load_rule_set(uploaded) == DEFAULT_RULE_SET
+
+
+@pytest.mark.parametrize("rule", [
+    {"column": "Price", "op": "=>", "value": 1},
+    {"column": "Beta", "op": ">", "value": 1},
+    {"column": "Price", "op": ">", "value": "1"},
+])
+def test_load_rule_set_rejects_invalid_rules(rule):
+    uploaded = io.BytesIO(json.dumps({"rules": [rule]}).encode())
+
+    with pytest.raises(ValueError):
+        load_rule_set(uploaded)
@@ -0,0 +1,28 @@
+import pandas as pd
+
+from trade_import import validate_trades
+from trades import TRADE_COLUMNS
+
+
+def raw_row(**overrides):
+    row = {col: "" for col in TRADE_COLUMNS}
+    row.update(
+        trade_date="03-04-2024", trade_time="09:45", strategy="Gap & Go", stock_symbol="aapl",
+        position_type="Long", shares="10", win_flag="true", ira_trade="false", paper_trade="true", ondemand_trade="false",
+    )
+    row.update(overrides)
+    return row
+
+
+def test_blank_trade_time_imports_as_null():
+    clean, rejected = validate_trades(pd.DataFrame([raw_row(trade_time=""), raw_row(trade_time="25:99")], dtype=str))
+
+    assert len(clean) == 1 and clean["trade_time"].isna().all()
+    assert rejected["reason"].tolist() == ["bad trade_time"]
+
+
+def test_blank_text_stays_empty_string():
+    clean, _ = validate_trades(pd.DataFrame([raw_row(premarket_news="")], dtype=str))
+
+    assert clean["premarket_news"].tolist() == [""]
+    assert clean["stock_symbol"].tolist() == ["AAPL"]
@@ -0,0 +1,157 @@
+import threading
+import time
+from collections import OrderedDict
+
+import pandas as pd
+import streamlit as st
+
+from analytics import performance_summary
+from trades import (
+    fetch_trades, fetch_data_version, fetch_changes, fetch_monthly_profit, fetch_key_stats,
+    fetch_summary, fetch_strategy_profit, compact_trades, search_trades,
+)
+
+VERSION_CHECK_TTL = 30          # seconds between DB version checks when this process made no writes
+MAX_CACHED_VIEWS = 8            # distinct sidebar filter combinations kept in memory
+MAX_INCREMENTAL_CHANGES = 50_000
+VIEW_MAX_AGE = 12 * 3600        # change log keeps a day of history; reload anything older than this
+
+# -------------------------------
+# 🧠 Versioned Trade Cache
+# -------------------------------
+class TradeCache:
+    """Process-wide cache of filtered trade frames keyed by the DB data version.
+
+    Write paths in this process call ``invalidate()`` so the next read picks up
+    the change immediately; writes from elsewhere are noticed within
+    ``VERSION_CHECK_TTL``. Only changed rows are re-fetched.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._views = OrderedDict()     # filters -> (frame, version, synced_at)
+        self._version = None
+        self._checked_at = 0.0
+        self._dirty = True
+
+    def invalidate(self):
+        with self._lock:
+            self._dirty = True
+
+    def _refresh_version(self):
+        now = time.monotonic()
+        if self._dirty or now - self._checked_at >= VERSION_CHECK_TTL:
+            self._version = fetch_data_version()
+            self._checked_at = now
+            self._dirty = False
+        return self._version
+
+    def data_version(self):
+        with self._lock:
+            return self._refresh_version()
+
+    def _apply_changes(self, frame, filters, since_version, version):
+        changes = fetch_changes(since_version, version)
+        if "T" in changes.values() or len(changes) > MAX_INCREMENTAL_CHANGES:
+            return fetch_trades(*filters)
+        touched = list(changes)
+        if not touched:
+            return frame
+        fresh = fetch_trades(*filters, ids=[i for i, op in changes.items() if op != "D"])
+        kept = frame[~frame["id"].isin(touched)]
+        if fresh.empty:
+            return kept.reset_index(drop=True)
+        if kept.empty:
+            return fresh
+        # Re-compact so categoricals with different categories do not decay to object
+        merged = compact_trades(pd.concat([kept, fresh], ignore_index=True))
+        return merged.sort_values(["trade_date", "trade_time"], kind="stable", ignore_index=True)
+
+    def get_trades(self, start_date, end_date, paper_only=False, ondemand_only=False, strategies=(), symbols=()):
+        filters = (start_date, end_date, paper_only, ondemand_only, tuple(strategies), tuple(symbols))
+        with self._lock:
+            version = self._refresh_version()
+            cached = self._views.get(filters)
+            now = time.monotonic()
+            if cached is None or now - cached[2] > VIEW_MAX_AGE:
+                frame = fetch_trades(*filters)
+            elif cached[1] != version:
+                frame = self._apply_changes(cached[0], filters, cached[1], version)
+            else:
+                frame = cached[0]
+                now = cached[2]
+            self._views[filters] = (frame, version, now)
+            self._views.move_to_end(filters)
+            while len(self._views) > MAX_CACHED_VIEWS:
+                self._views.popitem(last=False)
+        # Shallow copy: callers may add columns but must not mutate values of the shared frame
+        return frame.copy(deep=False)
+
+
+@st.cache_resource
+def get_trade_cache():
+    return TradeCache()
+
+
+def invalidate_trades():
+    """Call after any write to ``trades`` from this process."""
+    get_trade_cache().invalidate()
+
+# -------------------------------
+# 📊 Version-keyed Aggregates
+# -------------------------------
+@st.cache_data(max_entries=4)
+def _monthly_profit(version):
+    return fetch_monthly_profit()
+
+
+@st.cache_data(max_entries=4)
+def _key_stats(version):
+    return fetch_key_stats()
+
+
+@st.cache_data(max_entries=32)
+def _summary(version, *filters):
+    return fetch_summary(*filters)
+
+
+@st.cache_data(max_entries=32)
+def _strategy_profit(version, *filters):
+    return fetch_strategy_profit(*filters)
+
+
+def cached_monthly_profit():
+    return _monthly_profit(get_trade_cache().data_version())
+
+
+def cached_key_stats():
+    return _key_stats(get_trade_cache().data_version())
+
+
+def cached_summary(start_date, end_date, paper_only=False, ondemand_only=False, strategies=()):
+    return _summary(get_trade_cache().data_version(), start_date, end_date, paper_only, ondemand_only, tuple(strategies))
+
+
+def cached_strategy_profit(start_date, end_date, paper_only=False, ondemand_only=False, strategies=()):
+    return _strategy_profit(get_trade_cache().data_version(), start_date, end_date, paper_only, ondemand_only, tuple(strategies))
+
+
+@st.cache_data(max_entries=8)
+def _performance(version, *filters):
+    return performance_summary(get_trade_cache().get_trades(*filters))
+
+
+def cached_performance(start_date, end_date, paper_only=False, ondemand_only=False, strategies=(), symbols=()):
+    return _performance(
+        get_trade_cache().data_version(), start_date, end_date, paper_only, ondemand_only, tuple(strategies), tuple(symbols)
+    )
+
+
+@st.cache_data(max_entries=64)
+def _picker_page(version, *search):
+    return search_trades(*search)
+
+
+def cached_search_trades(symbol=None, strategy=None, start_date=None, end_date=None, after=None, limit=50):
+    """One delete-picker page, re-queried only when the search, the cursor or the data version changes."""
+    return _picker_page(get_trade_cache().data_version(), symbol, strategy, start_date, end_date, after, limit)
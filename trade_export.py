@@ -0,0 +1,71 @@
+import tempfile
+
+import pyarrow as pa
+import pyarrow.csv as pa_csv
+import pyarrow.parquet as pq
+
+from db import TimedCursor, get_connection
+from trades import TABLE_COLUMNS, TRADE_COLUMNS, NUMERIC_COLUMNS, BOOL_COLUMNS, TEXT_COLUMNS, build_trade_filter
+
+# Header-only CSV matching the import format
+TEMPLATE_CSV = (",".join(TRADE_COLUMNS) + "\n").encode("utf-8")
+
+SPOOL_MAX_MEMORY = 8 * 1024 * 1024     # exports larger than this spill to a temp file while streaming
+
+PARQUET_SCHEMA = {
+    "id": pa.int64(),
+    "trade_date": pa.date32(),
+    "trade_time": pa.time32("s"),
+    "shares": pa.int64(),
+    **{col: pa.float64() for col in NUMERIC_COLUMNS},
+    **{col: pa.bool_() for col in BOOL_COLUMNS},
+    **{col: pa.string() for col in TEXT_COLUMNS},
+}
+
+# -------------------------------
+# 📥 On-demand Export (COPY ... TO STDOUT)
+# -------------------------------
+def _copy_filtered(filters, select_columns, out):
+    where_sql, params = build_trade_filter(*filters)
+    with get_connection() as conn:
+        with conn.cursor(cursor_factory=TimedCursor) as cursor:
+            select_sql = cursor.mogrify(
+                f"SELECT {', '.join(select_columns)} FROM trades WHERE {where_sql} ORDER BY trade_date, trade_time",
+                params,
+            ).decode()
+            cursor.copy_expert(f"COPY ({select_sql}) TO STDOUT WITH (FORMAT csv, HEADER)", out)
+    out.seek(0)
+    return out
+
+
+def export_csv(filters):
+    """CSV bytes for the filtered trades, dates as MM-DD-YYYY like the dashboard table."""
+    select_columns = [
+        "to_char(trade_date, 'MM-DD-YYYY') AS trade_date" if col == "trade_date"
+        else "to_char(trade_time, 'HH24:MI') AS trade_time" if col == "trade_time"
+        else col
+        for col in TABLE_COLUMNS
+    ]
+    with tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_MEMORY) as out:
+        return _copy_filtered(filters, select_columns, out).read()
+
+
+def export_parquet(filters):
+    """Parquet bytes for the filtered trades, converted batch by batch from the COPY stream."""
+    with tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_MEMORY) as raw, \
+            tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_MEMORY) as out:
+        _copy_filtered(filters, TABLE_COLUMNS, raw)
+        reader = pa_csv.open_csv(
+            raw,
+            convert_options=pa_csv.ConvertOptions(
+                column_types=PARQUET_SCHEMA,
+                true_values=["t"],
+                false_values=["f"],
+                strings_can_be_null=False,
+            ),
+        )
+        with pq.ParquetWriter(out, reader.schema) as writer:
+            for batch in reader:
+                writer.write_batch(batch)
+        out.seek(0)
+        return out.read()
@@ -0,0 +1,128 @@
+import io
+
+import pandas as pd
+
+from db import TimedCursor, get_connection
+from trades import TRADE_COLUMNS, TEXT_COLUMNS, NUMERIC_COLUMNS, BOOL_COLUMNS, ensure_partitions
+
+IMPORT_CHUNK_SIZE = 20_000
+
+_TRUE_VALUES = {"true", "t", "yes", "y", "1", "1.0", "x", "win"}
+_FALSE_VALUES = {"false", "f", "no", "n", "0", "0.0", "", "nan", "none", "loss"}
+
+# -------------------------------
+# 🧪 Vectorized Validation & Coercion
+# -------------------------------
+def _parse_dates(series):
+    raw = series.astype("string").str.strip()
+    parsed = pd.to_datetime(raw, format="%m-%d-%Y", errors="coerce")  # export format
+    missing = parsed.isna()
+    if missing.any():
+        parsed[missing] = pd.to_datetime(raw[missing], format="%Y-%m-%d", errors="coerce")
+    return parsed.dt.date
+
+
+def _parse_times(series):
+    raw = series.astype("string").str.strip()
+    parsed = pd.to_datetime(raw, format="%H:%M", errors="coerce")
+    missing = parsed.isna()
+    if missing.any():
+        parsed[missing] = pd.to_datetime(raw[missing], format="%H:%M:%S", errors="coerce")
+    return parsed
+
+
+def _parse_bools(series):
+    raw = series.astype("string").str.strip().str.lower().fillna("")
+    values = pd.Series(pd.NA, index=series.index, dtype="boolean")
+    values[raw.isin(_TRUE_VALUES)] = True
+    values[raw.isin(_FALSE_VALUES)] = False
+    return values
+
+
+def validate_trades(df):
+    """Coerce a raw CSV frame to trade dtypes.
+
+    Returns (clean_df, rejected_df); rejected rows keep their original values
+    plus a ``reason`` column listing every failed check.
+    """
+    missing = [col for col in TRADE_COLUMNS if col not in df.columns]
+    if missing:
+        raise ValueError(f"CSV is missing columns: {', '.join(missing)}")
+
+    raw = df[TRADE_COLUMNS]
+    clean = pd.DataFrame(index=raw.index)
+    problems = {}
+
+    clean["trade_date"] = _parse_dates(raw["trade_date"])
+    problems["bad trade_date"] = clean["trade_date"].isna()
+
+    # trade_time is nullable (the export writes NULL as ""): blank imports as NULL, junk is rejected
+    times = _parse_times(raw["trade_time"])
+    clean["trade_time"] = times.dt.strftime("%H:%M:%S")
+    provided = raw["trade_time"].astype("string").str.strip().fillna("") != ""
+    problems["bad trade_time"] = times.isna() & provided
+
+    for col in TEXT_COLUMNS:
+        clean[col] = raw[col].astype("string").str.strip().fillna("")
+    clean["stock_symbol"] = clean["stock_symbol"].str.upper()
+    problems["missing stock_symbol"] = clean["stock_symbol"] == ""
+    problems["missing strategy"] = clean["strategy"] == ""
+
+    shares = pd.to_numeric(raw["shares"], errors="coerce")
+    problems["bad shares"] = shares.isna() | (shares <= 0) | (shares % 1 != 0)
+    clean["shares"] = shares.fillna(0).astype("int64")
+
+    for col in NUMERIC_COLUMNS:
+        values = pd.to_numeric(raw[col], errors="coerce")
+        provided = raw[col].astype("string").str.strip().fillna("") != ""
+        problems[f"bad {col}"] = values.isna() & provided
+        clean[col] = values
+
+    for col in BOOL_COLUMNS:
+        values = _parse_bools(raw[col])
+        problems[f"bad {col}"] = values.isna()
+        clean[col] = values.fillna(False).astype(bool)
+
+    reasons = pd.Series("", index=raw.index, dtype="object")
+    for label, mask in problems.items():
+        reasons = reasons.where(~mask, reasons + label + "; ")
+    rejected_mask = reasons != ""
+
+    rejected = df.loc[rejected_mask].copy()
+    rejected["reason"] = reasons[rejected_mask].str.rstrip("; ")
+    return clean.loc[~rejected_mask, TRADE_COLUMNS], rejected
+
+# -------------------------------
+# 🚚 Bulk COPY into Postgres
+# -------------------------------
+def copy_trades(clean_df, chunk_size=IMPORT_CHUNK_SIZE, progress=None):
+    """Stream validated trades into ``trades`` with COPY in one transaction.
+
+    ``progress`` is called with (rows_done, rows_total) after each chunk.
+    """
+    total = len(clean_df)
+    # to_csv writes "" and missing values alike; text columns are never missing here, so
+    # FORCE_NOT_NULL keeps their "" as empty strings while blank times/prices still load as NULL
+    copy_sql = (
+        f"COPY trades ({', '.join(TRADE_COLUMNS)}) FROM STDIN "
+        f"WITH (FORMAT csv, FORCE_NOT_NULL ({', '.join(TEXT_COLUMNS)}))"
+    )
+    with get_connection() as conn:
+        with conn.cursor(cursor_factory=TimedCursor) as cursor:
+            ensure_partitions(cursor, clean_df["trade_date"].unique())
+            for start in range(0, total, chunk_size):
+                chunk = clean_df.iloc[start:start + chunk_size]
+                buffer = io.StringIO()
+                chunk.to_csv(buffer, header=False, index=False)
+                buffer.seek(0)
+                cursor.copy_expert(copy_sql, buffer)
+                if progress:
+                    progress(min(start + chunk_size, total), total)
+    return total
+
+
+def import_trades(df, chunk_size=IMPORT_CHUNK_SIZE, progress=None):
+    """Validate a raw CSV frame and bulk-load the good rows. Returns (inserted, rejected_df)."""
+    clean, rejected = validate_trades(df)
+    inserted = copy_trades(clean, chunk_size, progress) if not clean.empty else 0
+    return inserted, rejected
@@ -0,0 +1,250 @@
+from datetime import timedelta
+
+import pandas as pd
+
+from db import TimedCursor, get_connection, run_query
+
+# -------------------------------
+# 🧾 Trades Table Layout
+# -------------------------------
+# Columns written by insert_trade / the CSV import, in table order (id excluded)
+TRADE_COLUMNS = [
+    "trade_date", "trade_time", "strategy", "stock_symbol", "position_type", "shares",
+    "buy_price", "sell_price", "stop_loss_price", "premarket_news", "emotion",
+    "net_gain_loss", "return_win", "return_loss", "return_percent", "return_percent_loss",
+    "total_investment", "fees", "gross_return", "win_flag", "ira_trade", "paper_trade", "ondemand_trade"
+]
+
+TEXT_COLUMNS = ["strategy", "stock_symbol", "position_type", "premarket_news", "emotion"]
+NUMERIC_COLUMNS = [
+    "buy_price", "sell_price", "stop_loss_price",
+    "net_gain_loss", "return_win", "return_loss", "return_percent", "return_percent_loss",
+    "total_investment", "fees", "gross_return"
+]
+BOOL_COLUMNS = ["win_flag", "ira_trade", "paper_trade", "ondemand_trade"]
+# Low-cardinality text columns stored as pandas categoricals in loaded frames
+CATEGORY_COLUMNS = TEXT_COLUMNS
+
+TABLE_COLUMNS = ["id"] + TRADE_COLUMNS
+
+# trade_time comes back as text so the frame can be built without per-row time objects
+SELECT_COLUMNS = ["to_char(trade_time, 'HH24:MI:SS') AS trade_time" if col == "trade_time" else col for col in TABLE_COLUMNS]
+
+STRATEGIES = ["Momentum", "Momentum Scaling (25%-50%-25%)", "Gap & Go", "Reversal", "Scalp"]
+
+# -------------------------------
+# 🗜️ Compact, Typed Trade Frame
+# -------------------------------
+def compact_trades(df):
+    """Return ``df`` with lean dtypes plus a vectorized ``hour`` column.
+
+    ``trade_time`` becomes the ``HH:MM`` display string; safe to call again on
+    an already compacted (or concatenated) frame.
+    """
+    df = df.copy()
+    df["id"] = pd.to_numeric(df["id"], downcast="integer")
+    df["trade_date"] = pd.to_datetime(df["trade_date"])
+
+    time_text = df["trade_time"].astype("string")
+    df["trade_time"] = time_text.str.slice(0, 5).fillna("")
+    df["hour"] = pd.to_numeric(time_text.str.slice(0, 2), errors="coerce").astype("Int8")
+
+    for col in CATEGORY_COLUMNS:
+        df[col] = df[col].astype("category").cat.remove_unused_categories()
+    df["shares"] = pd.to_numeric(df["shares"], errors="coerce").fillna(0).astype("int32")
+    for col in NUMERIC_COLUMNS:
+        df[col] = pd.to_numeric(df[col], errors="coerce").astype("float64")
+    for col in BOOL_COLUMNS:
+        df[col] = df[col].fillna(False).astype(bool)
+    return df
+
+
+def frame_memory_bytes(df):
+    return int(df.memory_usage(deep=True).sum())
+
+# -------------------------------
+# 🔎 Filtered Trade Queries
+# -------------------------------
+def build_trade_filter(start_date, end_date, paper_only=False, ondemand_only=False, strategies=None, symbols=None, ids=None):
+    """Return (where_sql, params) for the dashboard's sidebar filters, optionally limited to ``ids``."""
+    clauses = ["trade_date BETWEEN %s AND %s"]
+    params = [start_date, end_date]
+    if paper_only:
+        clauses.append("paper_trade")
+    if ondemand_only:
+        clauses.append("ondemand_trade")
+    if strategies:
+        clauses.append("strategy = ANY(%s)")
+        params.append(list(strategies))
+    if symbols:
+        clauses.append("stock_symbol = ANY(%s)")
+        params.append([s.strip().upper() for s in symbols])
+    if ids is not None:
+        clauses.append("id = ANY(%s)")
+        params.append([int(i) for i in ids])
+    return " AND ".join(clauses), params
+
+
+def fetch_trades(start_date, end_date, paper_only=False, ondemand_only=False, strategies=None, symbols=None, ids=None):
+    where_sql, params = build_trade_filter(start_date, end_date, paper_only, ondemand_only, strategies, symbols, ids)
+    rows = run_query(
+        f"SELECT {', '.join(SELECT_COLUMNS)} FROM trades WHERE {where_sql} ORDER BY trade_date, trade_time",
+        params,
+    )
+    return compact_trades(pd.DataFrame(rows or [], columns=TABLE_COLUMNS))
+
+# -------------------------------
+# 🗂️ Trade Picker (keyset pagination) & Batched Delete
+# -------------------------------
+PICKER_COLUMNS = ["id", "trade_date", "trade_time", "strategy", "stock_symbol", "net_gain_loss"]
+
+
+def search_trades(symbol=None, strategy=None, start_date=None, end_date=None, after=None, limit=50):
+    """One page of trades, newest first; ``after`` is the (trade_date, id) of the previous page's last row."""
+    clauses, params = ["TRUE"], []
+    if symbol:
+        clauses.append("stock_symbol LIKE %s")
+        params.append(symbol.strip().upper() + "%")
+    if strategy:
+        clauses.append("strategy = %s")
+        params.append(strategy)
+    if start_date is not None and end_date is not None:
+        clauses.append("trade_date BETWEEN %s AND %s")
+        params += [start_date, end_date]
+    if after is not None:
+        clauses.append("(trade_date, id) < (%s, %s)")
+        params += list(after)
+    rows = run_query(f"""
+        SELECT id, trade_date, to_char(trade_time, 'HH24:MI'), strategy, stock_symbol, net_gain_loss
+        FROM trades
+        WHERE {' AND '.join(clauses)}
+        ORDER BY trade_date DESC, id DESC
+        LIMIT %s
+    """, params + [limit])
+    return pd.DataFrame(rows or [], columns=PICKER_COLUMNS)
+
+
+def delete_trades(ids):
+    """Delete all ``ids`` in one statement (one transaction); returns the number removed."""
+    deleted = run_query("DELETE FROM trades WHERE id = ANY(%s) RETURNING id", ([int(i) for i in ids],))
+    return len(deleted or [])
+
+# -------------------------------
+# 🔢 Data Version / Change Log
+# -------------------------------
+def fetch_data_version():
+    return int(run_query("SELECT version FROM trade_data_version")[0][0])
+
+
+def fetch_changes(since_version, until_version):
+    """Return {trade_id: op} for changes in (since_version, until_version]."""
+    rows = run_query(
+        "SELECT trade_id, op FROM trade_changes WHERE version > %s AND version <= %s ORDER BY version",
+        (since_version, until_version),
+    )
+    return {trade_id: op for trade_id, op in rows or []}
+
+# -------------------------------
+# 📊 Rollup Aggregates (trade_daily_rollup)
+# -------------------------------
+def build_rollup_filter(start_date=None, end_date=None, paper_only=False, ondemand_only=False, strategies=None):
+    clauses, params = ["TRUE"], []
+    if start_date is not None and end_date is not None:
+        clauses.append("trade_date BETWEEN %s AND %s")
+        params += [start_date, end_date]
+    if paper_only:
+        clauses.append("paper_trade")
+    if ondemand_only:
+        clauses.append("ondemand_trade")
+    if strategies:
+        clauses.append("strategy = ANY(%s)")
+        params.append(list(strategies))
+    return " AND ".join(clauses), params
+
+
+def fetch_summary(start_date=None, end_date=None, paper_only=False, ondemand_only=False, strategies=None):
+    """Return (net_gain_loss, trade_count, win_count) for the filter; no dates means all history."""
+    where_sql, params = build_rollup_filter(start_date, end_date, paper_only, ondemand_only, strategies)
+    profit, trades, wins = run_query(f"""
+        SELECT COALESCE(SUM(net_gain_loss), 0), COALESCE(SUM(trade_count), 0), COALESCE(SUM(win_count), 0)
+        FROM trade_daily_rollup
+        WHERE {where_sql}
+    """, params)[0]
+    return float(profit), int(trades), int(wins)
+
+
+def fetch_strategy_profit(start_date, end_date, paper_only=False, ondemand_only=False, strategies=None):
+    where_sql, params = build_rollup_filter(start_date, end_date, paper_only, ondemand_only, strategies)
+    rows = run_query(f"""
+        SELECT strategy, SUM(net_gain_loss)
+        FROM trade_daily_rollup
+        WHERE {where_sql}
+        GROUP BY strategy
+        ORDER BY 2 DESC
+    """, params)
+    return pd.DataFrame(rows or [], columns=["strategy", "net_gain_loss"]).set_index("strategy")["net_gain_loss"].astype(float)
+
+
+def fetch_monthly_profit():
+    rows = run_query("""
+        SELECT to_char(date_trunc('month', trade_date), 'YYYY-MM') AS month, SUM(net_gain_loss)
+        FROM trade_daily_rollup
+        GROUP BY 1
+        ORDER BY 1
+    """)
+    return pd.DataFrame(rows or [], columns=["month", "net_gain_loss"]).set_index("month")["net_gain_loss"].astype(float)
+
+
+def fetch_key_stats():
+    """Return (total_profit, win_rate, total_trades) over the whole history."""
+    total_profit, total_trades, wins = fetch_summary()
+    win_rate = wins / total_trades if total_trades else 0.0
+    return total_profit, win_rate, total_trades
+
+# -------------------------------
+# 🧱 Monthly Partitions
+# -------------------------------
+def month_starts(dates):
+    """Distinct first-of-month dates for an iterable/Series of dates."""
+    months = pd.to_datetime(pd.Series(list(dates))).dropna().dt.to_period("M").unique()
+    return [month.start_time.date() for month in months]
+
+
+def ensure_partitions(cursor, dates):
+    """Create any missing monthly partitions for ``dates`` (call before inserting)."""
+    months = month_starts(dates)
+    if months:
+        cursor.execute("SELECT ensure_trade_partition(m) FROM unnest(%s::date[]) AS m", (months,))
+
+
+def _month_end(month):
+    return (pd.Timestamp(month) + pd.offsets.MonthEnd(0)).date()
+
+
+def delete_trade_range(start_date, end_date):
+    """Delete trades between two dates; whole months are dropped as partitions.
+
+    Returns (dropped_months, deleted_rows).
+    """
+    month = start_date if start_date.day == 1 else _month_end(start_date) + timedelta(days=1)
+    full_months = []
+    while _month_end(month) <= end_date:
+        full_months.append(month)
+        month = _month_end(month) + timedelta(days=1)
+
+    if full_months:
+        edges = [(start_date, full_months[0] - timedelta(days=1)), (_month_end(full_months[-1]) + timedelta(days=1), end_date)]
+    else:
+        edges = [(start_date, end_date)]
+
+    dropped, deleted = 0, 0
+    with get_connection() as conn:
+        with conn.cursor(cursor_factory=TimedCursor) as cursor:
+            for month in full_months:
+                cursor.execute("SELECT drop_trade_month(%s)", (month,))
+                dropped += cursor.fetchone()[0]  # FALSE when the month had no partition
+            for edge_start, edge_end in edges:
+                if edge_start <= edge_end:
+                    cursor.execute("DELETE FROM trades WHERE trade_date BETWEEN %s AND %s", (edge_start, edge_end))
+                    deleted += cursor.rowcount
+    return dropped, deleted
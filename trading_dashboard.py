@@ -1,30 +1,29 @@
 import streamlit as st
-import psycopg2
 import pandas as pd
 from datetime import datetime
 
+from db import run_query
+from trades import TRADE_COLUMNS, STRATEGIES, frame_memory_bytes, delete_trades, delete_trade_range
+from trade_cache import (
+    get_trade_cache, invalidate_trades, cached_monthly_profit, cached_key_stats,
+    cached_summary, cached_strategy_profit, cached_performance, cached_search_trades,
+)
+from trade_import import import_trades
+from trade_export import TEMPLATE_CSV, export_csv, export_parquet
+from candle_store import CandleStore, excursions, fetch_missing_candles, trade_days
+from finnhub_client import FinnhubClient
+from checklist import DEFAULT_CHECKLIST_RULES, evaluate_days, violations, compliance_calendar
+import instrumentation
+from instrumentation import checkpoint
+from config import SLOW_QUERY_MS, SLOW_RERUN_MS, SLOW_LOG_PATH, CHECKLIST_RULES, FINNHUB_CANDLE_CALLS_PER_MINUTE
+
 # -------------------------------
 # 🌟 USER SETTINGS (login)
 # -------------------------------
 USERNAME = "wolfnote"
 PASSWORD = "Beograd!98o"
 
-# -------------------------------
-# 🔌 Database Connection (Unified run_query)
-# -------------------------------
-def run_query(query, params=None):
-    with psycopg2.connect(
-        host=st.secrets["host"],
-        user=st.secrets["user"],
-        password=st.secrets["password"],
-        dbname=st.secrets["database"],
-        sslmode='require'
-    ) as conn:
-        with conn.cursor() as cursor:
-            cursor.execute(query, params)
-            if cursor.description:
-                return cursor.fetchall()
-            conn.commit()
+PICKER_PAGE_SIZE = 50
 
 # -------------------------------
 # 🌓 Dark Mode Toggle
@@ -90,29 +89,33 @@ def import_csv():
     uploaded_file = st.file_uploader("Choose a CSV file", type="csv")
     if uploaded_file is not None:
         try:
-            df = pd.read_csv(uploaded_file)
-            df["trade_time"] = pd.to_datetime(df["trade_time"], format="%H:%M", errors="coerce").dt.time
-
-            required_columns = [
-                "trade_date", "trade_time", "strategy", "stock_symbol", "position_type", "shares",
-                "buy_price", "sell_price", "stop_loss_price", "premarket_news", "emotion",
-                "net_gain_loss", "return_win", "return_loss", "return_percent", "return_percent_loss",
-                "total_investment", "fees", "gross_return", "win_flag", "ira_trade", "paper_trade", "ondemand_trade"
-            ]
-            if not all(col in df.columns for col in required_columns):
+            df = pd.read_csv(uploaded_file, dtype=str, keep_default_na=False)
+
+            if not all(col in df.columns for col in TRADE_COLUMNS):
                 st.error("❌ CSV format mismatch. Please use the export or template format.")
                 return
             if "csv_imported" not in st.session_state:
-                for _, row in df.iterrows():
-                    insert_trade(tuple(row[col] for col in required_columns), rerun=False)
+                progress_bar = st.progress(0.0, text="Importing trades...")
+                inserted, rejected = import_trades(
+                    df, progress=lambda done, total: progress_bar.progress(done / total, text=f"Imported {done:,} / {total:,} trades")
+                )
+                progress_bar.empty()
+                invalidate_trades()
 
                 st.session_state["csv_imported"] = True
-                st.success("✅ CSV import completed successfully!")
+                st.session_state["csv_rejected"] = rejected
+                st.success(f"✅ CSV import completed: {inserted:,} trades added.")
                 st.rerun()
 
         except Exception as e:
             st.error(f"❌ Failed to import: {e}")
 
+    # ⚠️ Rows skipped by the last import
+    rejected = st.session_state.get("csv_rejected")
+    if rejected is not None and not rejected.empty:
+        st.warning(f"⚠️ {len(rejected):,} rows were rejected during the last import.")
+        st.dataframe(rejected, use_container_width=True)
+
 # -------------------------------
 # 📥 Insert Trade
 # -------------------------------
@@ -134,7 +137,14 @@ def insert_trade(data, rerun=True):
             data[1] = data[1].time()
             data = tuple(data)
 
+        # Symbols are stored upper-case (as the CSV import does) so the filters and picker match them
+        data = list(data)
+        data[3] = str(data[3]).strip().upper()
+        data = tuple(data)
+
+        run_query("SELECT ensure_trade_partition(%s)", (data[0],))  # monthly partition for trade_date
         run_query(insert_query, data)
+        invalidate_trades()
         if rerun:
             st.success("✅ Trade submitted successfully!")
             st.rerun()
@@ -143,94 +153,30 @@ def insert_trade(data, rerun=True):
 
 
 # -------------------------------
-# 🗑️ Delete Trade
+# 🗑️ Delete Trades (batched)
 # -------------------------------
-def delete_trade(trade_id):
+def delete_selected_trades(trade_ids):
     try:
-        delete_query = "DELETE FROM trades WHERE id = %s"
-        run_query(delete_query, (trade_id,))
-        st.success(f"✅ Trade ID {trade_id} deleted successfully!")
+        deleted = delete_trades(trade_ids)
+        invalidate_trades()
+        st.session_state.pop("picker_selected", None)
+        st.success(f"✅ Deleted {deleted} trades.")
         st.rerun()
     except Exception as e:
-        st.error(f"❌ Error deleting trade: {e}")
+        st.error(f"❌ Error deleting trades: {e}")
 
 # -------------------------------
-# 🚀 App Main
+# 🧩 Independently Re-rendering Panels (fragments)
 # -------------------------------
-st.set_page_config(page_title="Trading Dashboard", layout="wide")
-set_theme()
-
-if check_login():
-    st.title("📈 Trading Tracker Dashboard")
-    
-    # 📤 CSV Import Panel (visible inside dashboard)
-    with st.expander("📤 Import Trades from CSV", expanded=False):
-        import_csv()
-
-        # Optional CSV template download button
-        template_columns = [
-            "trade_date", "trade_time", "strategy", "stock_symbol", "position_type", "shares",
-            "buy_price", "sell_price", "stop_loss_price", "premarket_news", "emotion",
-            "net_gain_loss", "return_win", "return_loss", "return_percent", "return_percent_loss",
-            "total_investment", "fees", "gross_return", "win_flag", "ira_trade", "paper_trade", "ondemand_trade"
-        ]
-        template_df = pd.DataFrame(columns=template_columns)
-
-        st.download_button(
-            label="📄 Download CSV Template",
-            data=template_df.to_csv(index=False).encode("utf-8"),
-            file_name="trade_template.csv",
-            mime="text/csv"
-        )
-
-    # ✅ Load Data
-    df = pd.DataFrame(
-    run_query("SELECT * FROM trades ORDER BY trade_date, trade_time"),
-    columns=["id", "trade_date", "trade_time", "strategy", "stock_symbol", "position_type", "shares",
-             "buy_price", "sell_price", "stop_loss_price", "premarket_news", "emotion",
-             "net_gain_loss", "return_win", "return_loss", "return_percent", "return_percent_loss",
-             "total_investment", "fees", "gross_return", "win_flag", "ira_trade", "paper_trade", "ondemand_trade"]
-    )
-
-    df['trade_date'] = pd.to_datetime(df['trade_date'])
-    from datetime import time  # ✅ Make sure this is already at the top
-
-    # ✅ Extract the hour safely for morning trade filter
-    df['hour'] = df['trade_time'].apply(lambda t: t.hour if isinstance(t, time) else None)
-
-    # ✅ Format trade_time column for display (HH:MM only, no seconds)
-    df['trade_time'] = df['trade_time'].apply(lambda t: t.strftime('%H:%M') if isinstance(t, time) else '')
-
-
-    # 📆 Date Range Filter (MM-DD-YYYY)
-    date_range = st.sidebar.date_input("Select Date Range", [datetime.now().date(), datetime.now().date()])
-
-    if isinstance(date_range, tuple) and len(date_range) == 2:
-        start_date, end_date = date_range
-    else:
-        start_date = end_date = date_range
-
-    # Initial date range filter
-    filtered_df = df[(df['trade_date'].dt.date >= start_date) & (df['trade_date'].dt.date <= end_date)]
-
-    # Add sidebar filters for Paper and OnDemand Trades
-    st.sidebar.markdown("### 🧩 Trade Type Filters")
-    paper_filter = st.sidebar.checkbox("Show Paper Trades Only")
-    ondemand_filter = st.sidebar.checkbox("Show OnDemand Trades Only")
-
-    # Apply filters
-    if paper_filter:
-        filtered_df = filtered_df[filtered_df['paper_trade'] == True]
-
-    if ondemand_filter:
-        filtered_df = filtered_df[filtered_df['ondemand_trade'] == True]
-
-    # 🚀 Trade Form
+# Widget interactions inside these only rerun the panel itself; writes call
+# st.rerun() (app scope) so the rest of the dashboard picks up new data.
+@st.fragment
+def trade_form():
     with st.form("trade_form"):
         st.subheader("🚀 Enter New Trade")
         trade_date = st.date_input("Trade Date", format="MM-DD-YYYY")
         trade_time = st.time_input("Trade Time")
-        strategy = st.selectbox("Strategy", ["Momentum", "Momentum Scaling (25%-50%-25%)", "Gap & Go", "Reversal", "Scalp"])
+        strategy = st.selectbox("Strategy", STRATEGIES)
         stock_symbol = st.text_input("Stock Symbol (e.g., AAPL, TSLA)")
         position_type = st.selectbox("Position Type", ["Long", "Short"])
         shares = st.number_input("Shares", step=1, min_value=1)
@@ -262,7 +208,9 @@ if check_login():
                 total_investment, fees, gross_return, win_flag, ira_trade, paper_trade, ondemand_trade
             ))
 
-    # 🗑️ Bulk Delete Trades in Date Range
+
+@st.fragment
+def bulk_delete_panel():
     with st.expander("🧹 Bulk Delete Trades by Date Range"):
         st.warning("⚠️ This will permanently delete all trades between the selected dates.")
         delete_range = st.date_input("Select Date Range to Delete", [datetime.now().date(), datetime.now().date()], key="delete_range")
@@ -273,98 +221,66 @@ if check_login():
 
             if confirm_bulk_delete:
                 try:
-                    run_query("""
-                        DELETE FROM trades
-                        WHERE trade_date BETWEEN %s AND %s
-                    """, (delete_start, delete_end))
-                    st.success(f"✅ Deleted trades from {delete_start} to {delete_end}")
+                    # Whole months are dropped as partitions; partial months use DELETE
+                    dropped_months, deleted_rows = delete_trade_range(delete_start, delete_end)
+                    invalidate_trades()
+                    st.success(f"✅ Deleted trades from {delete_start} to {delete_end} ({dropped_months} months dropped, {deleted_rows} rows deleted)")
                     st.rerun()
                 except Exception as e:
                     st.error(f"❌ Failed to delete: {e}")
 
 
-    # 🗑️ Delete Trade
-    with st.form("delete_form"):
-        st.subheader("🗑️ Delete Trade")
-        trade_ids = df['id'].tolist()
-        if trade_ids:
-            delete_id = st.selectbox("Select Trade ID to Delete", trade_ids)
-            delete_submit = st.form_submit_button("Delete Trade")
-            if delete_submit:
-                delete_trade(delete_id)
-        else:
-            st.info("No trades available to delete.")
-
-    # 📅 Summary
-    st.subheader(f"📅 Summary: {start_date.strftime('%m-%d-%Y')} to {end_date.strftime('%m-%d-%Y')}")
-    col1, col2, col3, col4 = st.columns(4)
-    daily_profit = filtered_df['net_gain_loss'].sum()
-    daily_trades = filtered_df.shape[0]
-    daily_win_rate = filtered_df['win_flag'].mean() * 100 if daily_trades > 0 else 0
-    daily_max_loss = -100
-    daily_profit_target = 200
-
-    col1.metric("Total P/L", f"${daily_profit:.2f}")
-    col2.metric("Trades Count", daily_trades)
-    col3.metric("Win Rate", f"{daily_win_rate:.1f}%")
-    col4.metric("Daily Goal", "Reached ✅" if daily_profit >= daily_profit_target else "Not yet ❌")
-
-    # 📝 Checklist
-    st.markdown("### 📝 Checklist Status")
-    trade_time_check = filtered_df.shape[0] == filtered_df[(filtered_df['hour'] >= 9) & (filtered_df['hour'] <= 12)].shape[0]
-
-    st.write("- Trade in simulator only ✅")
-    st.write(f"- Trade between 9:30 AM and 12:00 PM: {'✅' if trade_time_check else '⚠️ Some trades outside window'}")
-    st.write(f"- Use approved strategies only ✅")
-    st.write(f"- Max 4 trades/day: {'✅' if daily_trades <= 4 else '⚠️ Exceeded!'}")
-    st.write(f"- Daily Max Loss: {'✅' if daily_profit > daily_max_loss else '⚠️ Hit max loss!'}")
-    st.write(f"- Daily Profit Target: {'✅' if daily_profit >= daily_profit_target else 'Not yet ❌'}")
-
-    # 🧾 All Trades
-    st.subheader("🧾 All Trades")
-
-    st.dataframe(filtered_df, use_container_width=True)
+@st.fragment
+def delete_panel():
+    st.subheader("🗑️ Delete Trades")
+    col1, col2, col3 = st.columns(3)
+    symbol_search = col1.text_input("Symbol starts with", key="picker_symbol")
+    strategy_search = col2.selectbox("Strategy", ["All"] + STRATEGIES, key="picker_strategy")
+    use_dates = col3.checkbox("Filter by date", key="picker_use_dates")
+    picker_range = col3.date_input("Dates", [datetime.now().date(), datetime.now().date()], key="picker_range", disabled=not use_dates)
+    picker_start, picker_end = picker_range if use_dates and isinstance(picker_range, tuple) and len(picker_range) == 2 else (None, None)
+
+    # Keyset pagination: a stack of (trade_date, id) cursors, reset whenever the search changes
+    search = (symbol_search, strategy_search, picker_start, picker_end)
+    if st.session_state.get("picker_search") != search:
+        st.session_state["picker_search"] = search
+        st.session_state["picker_cursors"] = [None]
+    cursors = st.session_state["picker_cursors"]
+
+    page = cached_search_trades(
+        symbol_search, None if strategy_search == "All" else strategy_search, picker_start, picker_end,
+        after=cursors[-1], limit=PICKER_PAGE_SIZE,
+    )
 
+    # Remember labels of selected trades so selections survive paging
+    labels = st.session_state.setdefault("picker_labels", {})
+    for row in page.itertuples(index=False):
+        labels[row.id] = f"#{row.id} · {row.trade_date:%m-%d-%Y} {row.trade_time} · {row.stock_symbol} · {row.strategy} · ${row.net_gain_loss}"
+    selected = st.session_state.setdefault("picker_selected", [])
+    options = list(dict.fromkeys(selected + page["id"].tolist()))
 
-    # 📊 Charts
-    st.subheader("😌 Emotion Tracker")
-    st.bar_chart(filtered_df['emotion'].value_counts())
+    if not options:
+        st.info("No trades match this search.")
+        return
 
-    st.subheader("📰 Pre-Market News Impact")
-    st.bar_chart(filtered_df['premarket_news'].value_counts())
+    st.multiselect("Select Trades to Delete", options, format_func=lambda trade_id: labels.get(trade_id, f"#{trade_id}"), key="picker_selected")
 
-    st.subheader("💼 Profit by Strategy")
-    st.bar_chart(filtered_df.groupby("strategy")["net_gain_loss"].sum().sort_values(ascending=False))
+    nav1, nav2, nav3 = st.columns([1, 1, 3])
+    if nav1.button("◀ Prev", disabled=len(cursors) == 1):
+        cursors.pop()
+        st.rerun(scope="fragment")
+    if nav2.button("Next ▶", disabled=len(page) < PICKER_PAGE_SIZE):
+        last = page.iloc[-1]
+        cursors.append((last["trade_date"], int(last["id"])))
+        st.rerun(scope="fragment")
 
-    st.subheader("🕰️ Trade Time Distribution")
-    st.bar_chart(filtered_df['hour'].value_counts().sort_index())
+    chosen = st.session_state["picker_selected"]
+    if nav3.button(f"🗑️ Delete Selected ({len(chosen)})", disabled=not chosen):
+        delete_selected_trades(chosen)
 
-    df['month'] = df['trade_date'].dt.to_period('M')
-    st.subheader("📅 Monthly Profit")
-    st.bar_chart(df.groupby('month')['net_gain_loss'].sum())
 
-    # 📊 Key Stats
-    st.markdown("---")
-    st.subheader("📊 Key Stats")
-    kpi1, kpi2, kpi3 = st.columns(3)
-    kpi1.metric("Total Profit", f"${df['net_gain_loss'].sum():,.2f}")
-    kpi2.metric("Win Rate", f"{df['win_flag'].mean() * 100:.1f}%")
-    kpi3.metric("Total Trades", f"{len(df)}")
-
-    # 📥 Export to CSV ✅
-    st.markdown("---")
-    st.subheader("📥 Export Data")
-    if not filtered_df.empty:
-        st.download_button(
-            label="💾 Export Filtered Trades to CSV",
-            data=filtered_df.to_csv(index=False, date_format="%m-%d-%Y").encode('utf-8'),
-            file_name=f"trades_export_{datetime.now().strftime('%m-%d-%Y')}.csv",
-            mime='text/csv'
-        )
-    else:
-        st.info("No data to export for the selected date range.")
-        
-    # === 🧮 RRR Calculator (New Tab) === #
+@st.fragment
+def rrr_calculator():
     st.markdown("---")
     st.subheader("🧮 Risk-Reward Ratio (RRR) Calculator")
 
@@ -404,7 +320,7 @@ if check_login():
     col1.metric("Position Size (shares)", f"{position_size:.0f}")
     col2.metric("Total Investment ($)", f"{total_investment:.2f}")
     col3.metric("Max Potential Loss ($)", f"{max_loss:.2f}")
-    
+
     col1.metric("Potential Profit ($)", f"{potential_profit:.2f}")
 
     # Confirmation check ✅
@@ -416,4 +332,293 @@ if check_login():
     st.markdown("---")
     st.info("📌 Pro Tip: Aim for at least 1:2 or better RRR for high-probability setups!")
 
-    st.markdown("✅ Dashboard and RRR Calculator are fully operational!")
\ No newline at end of file
+    st.markdown("✅ Dashboard and RRR Calculator are fully operational!")
+
+
+@st.fragment
+def excursion_panel(trades):
+    # Stats and loads every symbol-day in range, so it only runs while switched on (an expander body always runs)
+    if not st.toggle("🎯 Trade Excursions (MAE / MFE)", key="show_excursions"):
+        return
+
+    store = get_candle_store()
+    pairs = trade_days(trades)
+    missing = store.missing(pairs)
+    st.caption(f"🕯️ Candles on disk for {len(pairs) - len(missing)} of {len(pairs)} symbol-days")
+
+    if missing and "finnhub_api_key" in st.secrets and st.button(f"📥 Fetch {len(missing)} missing symbol-days"):
+        progress_bar = st.progress(0.0, text="Fetching candles...")
+        try:
+            fetch_missing_candles(
+                get_finnhub_client(), store, missing,
+                on_result=lambda done, total: progress_bar.progress(done / total, text=f"Fetched {done} / {total} symbol-days")
+            )
+        except Exception as e:
+            st.error(f"❌ Failed to fetch candles: {e}")
+        progress_bar.empty()
+
+    stats = excursions(trades, store)
+    covered = stats["mae"].notna()
+    if not covered.any():
+        st.info("No candle data for these trades yet.")
+        return
+    table = trades.loc[covered, ["id", "trade_date", "trade_time", "stock_symbol", "position_type", "net_gain_loss"]].join(stats[covered])
+    st.dataframe(table, use_container_width=True)
+    st.scatter_chart(table, x="mae_r", y="mfe_r")
+
+
+@st.cache_resource
+def get_candle_store():
+    return CandleStore()
+
+
+@st.cache_resource
+def get_finnhub_client():
+    return FinnhubClient(st.secrets["finnhub_api_key"], per_minute=FINNHUB_CANDLE_CALLS_PER_MINUTE)
+
+
+# -------------------------------
+# 📝 Checklist Rules (sidebar)
+# -------------------------------
+def checklist_rules_editor():
+    # Defaults come from secrets ([checklist]); the sidebar only tweaks them for this session
+    rules = {**DEFAULT_CHECKLIST_RULES, **CHECKLIST_RULES}
+    with st.sidebar.expander("📝 Checklist Rules"):
+        window_start = st.time_input("Window start", datetime.strptime(rules["window_start"], "%H:%M").time())
+        window_end = st.time_input("Window end", datetime.strptime(rules["window_end"], "%H:%M").time())
+        max_trades = st.number_input("Max trades/day", value=int(rules["max_trades_per_day"]), min_value=1)
+        max_loss = st.number_input("Daily max loss ($)", value=float(rules["daily_max_loss"]), max_value=0.0)
+        target = st.number_input("Daily profit target ($)", value=float(rules["daily_profit_target"]), min_value=0.0)
+        approved = st.multiselect("Approved strategies", STRATEGIES, default=[s for s in rules["approved_strategies"] if s in STRATEGIES])
+        simulator_only = st.checkbox("Simulator (paper) trades only", value=bool(rules["simulator_only"]))
+    return {
+        "window_start": window_start.strftime("%H:%M"),
+        "window_end": window_end.strftime("%H:%M"),
+        "max_trades_per_day": int(max_trades),
+        "daily_max_loss": max_loss,
+        "daily_profit_target": target,
+        "approved_strategies": approved,
+        "simulator_only": simulator_only,
+    }
+
+
+# -------------------------------
+# 🚀 App Main
+# -------------------------------
+st.set_page_config(page_title="Trading Dashboard", layout="wide")
+instrumentation.configure(SLOW_QUERY_MS, SLOW_RERUN_MS, SLOW_LOG_PATH)
+instrumentation.start_rerun("dashboard")
+show_timings = st.sidebar.checkbox("🐞 Show Timing Breakdown")
+set_theme()
+
+if check_login():
+    st.title("📈 Trading Tracker Dashboard")
+    
+    # 📤 CSV Import Panel (visible inside dashboard)
+    with st.expander("📤 Import Trades from CSV", expanded=False):
+        import_csv()
+
+        # Optional CSV template download button
+        st.download_button(
+            label="📄 Download CSV Template",
+            data=TEMPLATE_CSV,
+            file_name="trade_template.csv",
+            mime="text/csv"
+        )
+
+    checkpoint("CSV import panel")
+
+    # 📆 Date Range Filter (MM-DD-YYYY)
+    date_range = st.sidebar.date_input("Select Date Range", [datetime.now().date(), datetime.now().date()])
+
+    if isinstance(date_range, tuple) and len(date_range) == 2:
+        start_date, end_date = date_range
+    else:
+        start_date = end_date = date_range
+
+    # Add sidebar filters for Paper and OnDemand Trades
+    st.sidebar.markdown("### 🧩 Trade Type Filters")
+    paper_filter = st.sidebar.checkbox("Show Paper Trades Only")
+    ondemand_filter = st.sidebar.checkbox("Show OnDemand Trades Only")
+    strategy_filter = st.sidebar.multiselect("Strategies", STRATEGIES)
+    symbol_filter = [s for s in st.sidebar.text_input("Symbols (comma separated)").split(",") if s.strip()]
+    checklist_rules = checklist_rules_editor()
+
+    # ✅ Load Data (filters applied in SQL, served from the versioned cache)
+    filtered_df = get_trade_cache().get_trades(start_date, end_date, paper_filter, ondemand_filter, strategy_filter, symbol_filter)
+
+    st.sidebar.caption(f"🧠 Loaded {len(filtered_df):,} trades ({frame_memory_bytes(filtered_df) / 1024:,.0f} KB in memory)")
+
+    checkpoint("Load data")
+
+    # 🚀 Trade Form
+    trade_form()
+
+    # 🗑️ Bulk Delete Trades in Date Range
+    bulk_delete_panel()
+
+    # 🗑️ Delete Trades
+    delete_panel()
+
+    checkpoint("Trade form & delete panels")
+
+    # 📅 Summary
+    st.subheader(f"📅 Summary: {start_date.strftime('%m-%d-%Y')} to {end_date.strftime('%m-%d-%Y')}")
+    col1, col2, col3, col4 = st.columns(4)
+    rollup_filters = (start_date, end_date, paper_filter, ondemand_filter, strategy_filter)
+    if symbol_filter:
+        # Rollup has no symbol dimension; aggregate the (already symbol-filtered) frame instead
+        daily_profit = filtered_df['net_gain_loss'].sum()
+        daily_trades = filtered_df.shape[0]
+        daily_wins = int(filtered_df['win_flag'].sum())
+    else:
+        daily_profit, daily_trades, daily_wins = cached_summary(*rollup_filters)
+    daily_win_rate = daily_wins / daily_trades * 100 if daily_trades > 0 else 0
+
+    col1.metric("Total P/L", f"${daily_profit:.2f}")
+    col2.metric("Trades Count", daily_trades)
+    col3.metric("Win Rate", f"{daily_win_rate:.1f}%")
+    col4.metric("Daily Goal", "Reached ✅" if daily_profit >= checklist_rules["daily_profit_target"] else "Not yet ❌")
+
+    # 📝 Checklist (evaluated per trading day, not over the whole range)
+    st.markdown("### 📝 Checklist Status")
+    checklist_days = evaluate_days(filtered_df, checklist_rules)
+    n_days = len(checklist_days)
+
+    def day_status(broken_days, failing="⚠️"):
+        return "✅" if broken_days == 0 else f"{failing} {broken_days} of {n_days} days"
+
+    if checklist_rules["simulator_only"]:
+        st.write(f"- Trade in simulator only: {day_status(int((checklist_days['live_trades'] > 0).sum()))}")
+    st.write(f"- Trade between {checklist_rules['window_start']} and {checklist_rules['window_end']}: "
+             f"{day_status(int((checklist_days['outside_window'] > 0).sum()))}")
+    st.write(f"- Use approved strategies only: {day_status(int((checklist_days['unapproved_strategy'] > 0).sum()))}")
+    st.write(f"- Max {checklist_rules['max_trades_per_day']} trades/day: {day_status(int(checklist_days['over_trade_limit'].sum()))}")
+    st.write(f"- Daily Max Loss (${checklist_rules['daily_max_loss']:,.0f}): {day_status(int(checklist_days['max_loss_hit'].sum()))}")
+    st.write(f"- Daily Profit Target (${checklist_rules['daily_profit_target']:,.0f}): "
+             f"reached on {int(checklist_days['target_reached'].sum())} of {n_days} days")
+
+    if n_days:
+        st.caption(f"{int(checklist_days['compliant'].sum())} of {n_days} trading days fully compliant")
+        with st.expander("📆 Compliance Calendar"):
+            st.dataframe(compliance_calendar(checklist_days), use_container_width=True)
+        rule_violations = violations(checklist_days, checklist_rules)
+        if not rule_violations.empty:
+            with st.expander(f"⚠️ Rule Violations ({len(rule_violations):,})"):
+                st.dataframe(
+                    rule_violations,
+                    use_container_width=True,
+                    hide_index=True,
+                    column_config={"trade_date": st.column_config.DateColumn("Date", format="MM-DD-YYYY")},
+                )
+
+    checkpoint("Summary & checklist")
+
+    # 🧾 All Trades
+    st.subheader("🧾 All Trades")
+
+    st.dataframe(filtered_df, use_container_width=True)
+
+
+    checkpoint("All trades table")
+
+    # 📊 Charts
+    st.subheader("😌 Emotion Tracker")
+    st.bar_chart(filtered_df['emotion'].value_counts())
+
+    st.subheader("📰 Pre-Market News Impact")
+    st.bar_chart(filtered_df['premarket_news'].value_counts())
+
+    st.subheader("💼 Profit by Strategy")
+    if symbol_filter:
+        st.bar_chart(filtered_df.groupby("strategy", observed=True)["net_gain_loss"].sum().sort_values(ascending=False))
+    else:
+        st.bar_chart(cached_strategy_profit(*rollup_filters))
+
+    st.subheader("🕰️ Trade Time Distribution")
+    st.bar_chart(filtered_df['hour'].value_counts().sort_index())
+
+    st.subheader("📅 Monthly Profit")
+    st.bar_chart(cached_monthly_profit())
+
+    checkpoint("Charts")
+
+    # 📈 Performance Analytics
+    st.markdown("---")
+    st.subheader("📈 Performance Analytics")
+    perf = cached_performance(start_date, end_date, paper_filter, ondemand_filter, strategy_filter, symbol_filter)
+    if filtered_df.empty:
+        st.info("No trades in the selected range.")
+    else:
+        perf1, perf2, perf3, perf4 = st.columns(4)
+        perf1.metric("Max Drawdown", f"${perf['max_drawdown']:,.2f}", f"{perf['drawdown_days']} days / {perf['drawdown_trades']} trades", delta_color="off")
+        perf2.metric("Expectancy / Trade", f"${perf['expectancy']:,.2f}")
+        perf3.metric("Profit Factor", f"{perf['profit_factor']:.2f}")
+        streak = perf["streaks"]
+        perf4.metric("Longest Win / Loss Streak", f"{streak['longest_win']} / {streak['longest_loss']}", f"current {streak['current']:+d}", delta_color="off")
+
+        st.markdown("#### 💹 Equity Curve")
+        st.line_chart(perf["daily_equity"]["equity"])
+        st.markdown("#### 🌊 Drawdown")
+        st.area_chart(perf["daily_equity"]["drawdown"])
+
+        edge1, edge2, edge3 = st.tabs(["By Strategy", "By Emotion", "By Hour"])
+        edge1.dataframe(perf["by_strategy"], use_container_width=True)
+        edge2.dataframe(perf["by_emotion"], use_container_width=True)
+        edge3.dataframe(perf["by_hour"], use_container_width=True)
+
+    checkpoint("Performance analytics")
+
+    # 🎯 Trade Excursions (MAE / MFE)
+    excursion_panel(filtered_df)
+
+    checkpoint("Trade excursions")
+
+    # 📊 Key Stats
+    st.markdown("---")
+    st.subheader("📊 Key Stats")
+    kpi1, kpi2, kpi3 = st.columns(3)
+    total_profit, win_rate, total_trades = cached_key_stats()
+    kpi1.metric("Total Profit", f"${total_profit:,.2f}")
+    kpi2.metric("Win Rate", f"{win_rate * 100:.1f}%")
+    kpi3.metric("Total Trades", f"{total_trades}")
+
+    checkpoint("Key stats")
+
+    # 📥 Export to CSV ✅
+    st.markdown("---")
+    st.subheader("📥 Export Data")
+    if not filtered_df.empty:
+        # Built only on request, streamed from Postgres with COPY for the current filters
+        export_format = st.radio("Export Format", ["CSV", "Parquet"], horizontal=True)
+        export_filters = (start_date, end_date, paper_filter, ondemand_filter, strategy_filter, symbol_filter)
+        if st.button("📦 Prepare Export"):
+            with st.spinner("Streaming trades from the database..."):
+                export_data = export_csv(export_filters) if export_format == "CSV" else export_parquet(export_filters)
+            st.session_state["export_file"] = (export_format, export_filters, export_data)
+
+        prepared = st.session_state.get("export_file")
+        if prepared and prepared[:2] == (export_format, export_filters):
+            extension, mime = ("csv", "text/csv") if export_format == "CSV" else ("parquet", "application/vnd.apache.parquet")
+            st.download_button(
+                label=f"💾 Export Filtered Trades to {export_format}",
+                data=prepared[2],
+                file_name=f"trades_export_{datetime.now().strftime('%m-%d-%Y')}.{extension}",
+                mime=mime
+            )
+        elif prepared:
+            # Filters or format changed; drop the stale file instead of holding it in session memory
+            del st.session_state["export_file"]
+    else:
+        st.info("No data to export for the selected date range.")
+        
+    checkpoint("Export")
+
+    # === 🧮 RRR Calculator (New Tab) === #
+    rrr_calculator()
+    checkpoint("RRR calculator")
+
+# 🐞 Timing breakdown / slow-rerun log
+profile = instrumentation.finish_rerun()
+if show_timings and profile is not None:
+    instrumentation.render_debug_panel(profile)